@@ -5,11 +5,25 @@ Implementation of core finite state automata algorithms:
 - ε-closure computation for ε-NFA support
 - Subset construction for NFA→DFA conversion
 - Hopcroft's algorithm for DFA minimization
+- Integer-interned (compiled) FSA representation for hot loops
 """
 
 from .epsilon_closure import epsilon_closure, epsilon_closure_set
 from .nfa_to_dfa import nfa_to_dfa, subset_construction
-from .minimization import minimize_dfa, hopcroft_minimization
+from .minimization import (
+    minimize_dfa,
+    hopcroft_minimization,
+    hopcroft_partition,
+    dfas_equivalent,
+)
+from .partition import RefinablePartition
+from .compiled import (
+    CompiledFSA,
+    BitsetNFA,
+    compile_fsa,
+    compile_nfa,
+    transition_columns,
+)
 
 __all__ = [
     # ε-closure
@@ -21,4 +35,13 @@ __all__ = [
     # DFA minimization
     "minimize_dfa",
     "hopcroft_minimization",
+    "hopcroft_partition",
+    "dfas_equivalent",
+    "RefinablePartition",
+    # Compiled representation
+    "CompiledFSA",
+    "BitsetNFA",
+    "compile_fsa",
+    "compile_nfa",
+    "transition_columns",
 ]
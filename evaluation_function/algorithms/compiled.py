@@ -0,0 +1,196 @@
+"""
+Compiled FSA Representation
+
+Interns state and symbol identifiers to contiguous integers once per FSA,
+so hot loops (BFS, simulation, product constructions) can work on int
+keys and tables instead of hashing strings on every step. Strings are
+only materialized again at the Pydantic boundary.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from ..schemas import FSA, Transition
+from .epsilon_closure import compute_all_epsilon_closures
+
+EPSILON_SYMBOLS = ("ε", "epsilon", "")
+
+
+@dataclass(frozen=True)
+class CompiledFSA:
+    """
+    Integer-indexed view of an FSA.
+
+    Attributes:
+        states: Index -> state identifier
+        symbols: Index -> alphabet symbol (ε excluded)
+        state_to_idx: State identifier -> index
+        sym_to_idx: Alphabet symbol -> index
+        delta: delta[q][a] -> destination index, or -1 if undefined
+            (for NFAs the last listed transition wins)
+        accept_mask: Bit q is set iff state q is accepting
+        initial: Index of the initial state, or -1 if it is not a state
+    """
+    states: List[str]
+    symbols: List[str]
+    state_to_idx: Dict[str, int]
+    sym_to_idx: Dict[str, int]
+    delta: List[List[int]]
+    accept_mask: int
+    initial: int
+
+    def is_accepting(self, q: int) -> bool:
+        return q >= 0 and (self.accept_mask >> q) & 1 == 1
+
+    def step(self, q: int, a: int) -> int:
+        if q < 0 or a < 0:
+            return -1
+        return self.delta[q][a]
+
+
+@dataclass(frozen=True)
+class BitsetNFA:
+    """
+    Bitset view of an NFA/ε-NFA: a set of states is a single Python int.
+
+    Attributes:
+        states: Index -> state identifier (bit q stands for states[q])
+        sym_to_idx: Alphabet symbol -> index (ε excluded)
+        step: step[q][a] -> mask of states reachable from q on a, ε-closed
+        initial_mask: ε-closure of the initial state (0 if it is not a state)
+        accept_mask: Bit q is set iff state q is accepting
+    """
+    states: List[str]
+    sym_to_idx: Dict[str, int]
+    step: List[List[int]]
+    initial_mask: int
+    accept_mask: int
+
+    def move(self, mask: int, a: int) -> int:
+        """Set of states reached from `mask` on symbol index `a`."""
+        step = self.step
+        nxt = 0
+        while mask:
+            low = mask & -mask
+            nxt |= step[low.bit_length() - 1][a]
+            mask ^= low
+        return nxt
+
+
+def transition_columns(transitions: List[Transition]) -> Tuple[tuple, tuple, tuple]:
+    """
+    Split transitions into parallel (from_state, symbol, to_state) columns.
+
+    Scans that only need one or two fields can zip the columns directly
+    instead of going through Transition attribute access per element.
+
+    Args:
+        transitions: List of all transitions in the FSA
+
+    Returns:
+        Tuple of (from_states, symbols, to_states), each aligned by index
+    """
+    if not transitions:
+        return (), (), ()
+    return tuple(zip(*((t.from_state, t.symbol, t.to_state) for t in transitions)))
+
+
+def _intern(fsa: FSA) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Assign contiguous indices to states and (non-ε) alphabet symbols."""
+    state_to_idx: Dict[str, int] = {}
+    for s in fsa.states:
+        state_to_idx.setdefault(s, len(state_to_idx))
+    sym_to_idx: Dict[str, int] = {}
+    for a in fsa.alphabet:
+        if a not in EPSILON_SYMBOLS:
+            sym_to_idx.setdefault(a, len(sym_to_idx))
+    return state_to_idx, sym_to_idx
+
+
+def compile_fsa(fsa: FSA) -> CompiledFSA:
+    """
+    Build the integer-indexed view of an FSA.
+
+    Transitions referencing unknown states or symbols (including ε) are
+    ignored; run is_valid_fsa first if those need to be reported.
+
+    Args:
+        fsa: The FSA to compile
+
+    Returns:
+        CompiledFSA with interned states/symbols and a dense delta table
+    """
+    state_to_idx, sym_to_idx = _intern(fsa)
+
+    n_syms = len(sym_to_idx)
+    delta = [[-1] * n_syms for _ in state_to_idx]
+    for t in fsa.transitions:
+        q = state_to_idx.get(t.from_state)
+        a = sym_to_idx.get(t.symbol)
+        r = state_to_idx.get(t.to_state)
+        if q is not None and a is not None and r is not None:
+            delta[q][a] = r
+
+    accept_mask = 0
+    for s in fsa.accept_states:
+        q = state_to_idx.get(s)
+        if q is not None:
+            accept_mask |= 1 << q
+
+    return CompiledFSA(
+        states=list(state_to_idx),
+        symbols=list(sym_to_idx),
+        state_to_idx=state_to_idx,
+        sym_to_idx=sym_to_idx,
+        delta=delta,
+        accept_mask=accept_mask,
+        initial=state_to_idx.get(fsa.initial_state, -1),
+    )
+
+
+def compile_nfa(fsa: FSA) -> BitsetNFA:
+    """
+    Build the bitset view of an NFA/ε-NFA.
+
+    ε-closures are folded into the step table and the initial mask, so
+    simulation is a plain OR over the set bits for each input symbol.
+
+    Args:
+        fsa: The FSA to compile (DFAs work too, but compile_fsa is cheaper)
+
+    Returns:
+        BitsetNFA with interned states/symbols and ε-closed step masks
+    """
+    state_to_idx, sym_to_idx = _intern(fsa)
+
+    closures = compute_all_epsilon_closures(fsa)
+    closure_mask = [0] * len(state_to_idx)
+    for s, q in state_to_idx.items():
+        for r in closures[s]:
+            r_idx = state_to_idx.get(r)
+            if r_idx is not None:
+                closure_mask[q] |= 1 << r_idx
+
+    n_syms = len(sym_to_idx)
+    step = [[0] * n_syms for _ in state_to_idx]
+    for t in fsa.transitions:
+        q = state_to_idx.get(t.from_state)
+        a = sym_to_idx.get(t.symbol)
+        r = state_to_idx.get(t.to_state)
+        if q is not None and a is not None and r is not None:
+            step[q][a] |= closure_mask[r]
+
+    accept_mask = 0
+    for s in fsa.accept_states:
+        q = state_to_idx.get(s)
+        if q is not None:
+            accept_mask |= 1 << q
+
+    initial = state_to_idx.get(fsa.initial_state)
+    return BitsetNFA(
+        states=list(state_to_idx),
+        sym_to_idx=sym_to_idx,
+        step=step,
+        initial_mask=closure_mask[initial] if initial is not None else 0,
+        accept_mask=accept_mask,
+    )
@@ -5,8 +5,11 @@ Implements Hopcroft's algorithm for DFA minimization.
 Produces a minimal DFA that accepts the same language.
 """
 
-from typing import Set, Dict, List, FrozenSet, Tuple
+from collections import deque
+from typing import Dict, List
 from ..schemas import FSA, Transition
+from .compiled import CompiledFSA, compile_fsa
+from .partition import RefinablePartition
 
 
 def hopcroft_minimization(dfa: FSA) -> FSA:
@@ -47,150 +50,126 @@ def hopcroft_minimization(dfa: FSA) -> FSA:
     if not dfa.states:
         return dfa
     
-    # Build transition function as a dictionary
-    transitions_dict: Dict[Tuple[str, str], str] = {}
-    for trans in dfa.transitions:
-        transitions_dict[(trans.from_state, trans.symbol)] = trans.to_state
+    # Work on the integer transition table instead of (state, symbol) strings
+    compiled = compile_fsa(dfa)
+    block_of = hopcroft_partition(compiled)
     
-    # Initialize partitions: accepting vs non-accepting states
-    accept_set = set(dfa.accept_states)
-    non_accept_set = set(dfa.states) - accept_set
+    # Build the minimized DFA
+    return build_minimal_dfa(dfa, compiled, block_of)
+
+
+def hopcroft_partition(compiled: CompiledFSA) -> List[int]:
+    """
+    Compute the Myhill-Nerode equivalence classes of a compiled DFA.
+    
+    Runs Hopcroft's refinement on a RefinablePartition, so a split costs
+    time proportional to the states that move rather than allocating new
+    sets. Missing transitions behave like an implicit dead state. All
+    states are classified; remove unreachable states first if they should
+    not count.
+    
+    Args:
+        compiled: Integer table of a DFA
+        
+    Returns:
+        block_of, where block_of[q] == block_of[r] iff states q and r
+        accept exactly the same strings
+    """
+    n_states = len(compiled.states)
+    n_syms = len(compiled.symbols)
+    
+    # inverse[a][r]: states with an a-transition into r
+    inverse: List[List[List[int]]] = [[[] for _ in range(n_states)] for _ in range(n_syms)]
+    for q, row in enumerate(compiled.delta):
+        for a, r in enumerate(row):
+            if r >= 0:
+                inverse[a][r].append(q)
     
-    # Start with initial partition
-    partitions: Set[FrozenSet[str]] = set()
-    if accept_set:
-        partitions.add(frozenset(accept_set))
-    if non_accept_set:
-        partitions.add(frozenset(non_accept_set))
+    # Initialize partitions: accepting vs non-accepting states
+    partition = RefinablePartition(n_states)
+    for q in range(n_states):
+        if compiled.is_accepting(q):
+            partition.mark(q)
+    partition.split()
     
-    # Work queue for partitions to process
-    work_queue: List[FrozenSet[str]] = list(partitions)
+    # Work queue of splitter blocks
+    work_queue = deque(range(partition.set_count))
     
     # Iteratively refine partitions
     while work_queue:
-        splitter = work_queue.pop(0)
+        splitter = work_queue.popleft()
+        # Snapshot: the splitter itself may be split while it is processed
+        splitter_members = partition.members(splitter)
         
-        for symbol in dfa.alphabet:
-            # Find states that transition into splitter on symbol
-            predecessors: Set[str] = set()
-            for state in dfa.states:
-                target = transitions_dict.get((state, symbol))
-                if target and target in splitter:
-                    predecessors.add(state)
-            
-            # Try to split each partition
-            partitions_to_remove = []
-            partitions_to_add = []
-            
-            for partition in partitions:
-                # Split partition into those in predecessors and those not
-                in_pred = partition & predecessors
-                not_in_pred = partition - predecessors
-                
-                # If both sets are non-empty, we can split
-                if in_pred and not_in_pred:
-                    partitions_to_remove.append(partition)
-                    
-                    in_pred_frozen = frozenset(in_pred)
-                    not_in_pred_frozen = frozenset(not_in_pred)
-                    
-                    partitions_to_add.append(in_pred_frozen)
-                    partitions_to_add.append(not_in_pred_frozen)
-                    
-                    # Add to work queue
-                    if partition in work_queue:
-                        work_queue.remove(partition)
-                        work_queue.append(in_pred_frozen)
-                        work_queue.append(not_in_pred_frozen)
-                    else:
-                        # Add the smaller partition
-                        if len(in_pred) <= len(not_in_pred):
-                            work_queue.append(in_pred_frozen)
-                        else:
-                            work_queue.append(not_in_pred_frozen)
+        for a in range(n_syms):
+            # Mark the states that transition into splitter on symbol a
+            for r in splitter_members:
+                for q in inverse[a][r]:
+                    partition.mark(q)
             
-            # Update partitions
-            for p in partitions_to_remove:
-                partitions.discard(p)
-            for p in partitions_to_add:
-                partitions.add(p)
+            # The new block is always the smaller half, so queueing it is
+            # enough whether or not the old block is still pending
+            for _, new_block in partition.split():
+                work_queue.append(new_block)
     
-    # Build the minimized DFA
-    return build_minimal_dfa(dfa, partitions, transitions_dict)
+    return list(partition.set_of)
 
 
 def build_minimal_dfa(
     original_dfa: FSA,
-    partitions: Set[FrozenSet[str]],
-    transitions_dict: Dict[Tuple[str, str], str]
+    compiled: CompiledFSA,
+    block_of: List[int]
 ) -> FSA:
     """
-    Build a minimal DFA from state partitions.
+    Build a minimal DFA from a block (equivalence class) id per state.
+    
+    Blocks are named q0, q1, ... in order of their first member state, so
+    the result does not depend on how the partition was stored.
     
     Args:
         original_dfa: The original DFA
-        partitions: Equivalence classes of states
-        transitions_dict: Transition function of original DFA
+        compiled: Integer table of original_dfa
+        block_of: block_of[q] is the equivalence class of state q
         
     Returns:
         The minimal DFA
+        
+    Raises:
+        ValueError: If the initial state is not one of the DFA's states
     """
-    # Create mapping from original state to partition (new state)
-    state_to_partition: Dict[str, FrozenSet[str]] = {}
-    for partition in partitions:
-        for state in partition:
-            state_to_partition[state] = partition
-    
-    # Create new state names
-    partition_to_name: Dict[FrozenSet[str], str] = {}
-    for i, partition in enumerate(partitions):
-        partition_to_name[partition] = f"q{i}"
-    
-    # Find initial state partition
-    initial_partition = state_to_partition[original_dfa.initial_state]
-    initial_state = partition_to_name[initial_partition]
-    
-    # Find accepting states (partitions containing any accepting state)
-    accept_states: List[str] = []
-    original_accept_set = set(original_dfa.accept_states)
-    for partition in partitions:
-        if partition & original_accept_set:
-            accept_states.append(partition_to_name[partition])
-    
-    # Build transitions for minimal DFA
+    if compiled.initial < 0:
+        raise ValueError(f"Initial state '{original_dfa.initial_state}' not in states")
+    
+    # Create new state names, numbering blocks by first appearance
+    block_name: Dict[int, str] = {}
+    representatives: List[int] = []
+    for q, block in enumerate(block_of):
+        if block not in block_name:
+            block_name[block] = f"q{len(block_name)}"
+            representatives.append(q)
+    
+    # Build transitions for minimal DFA from one representative per block
     minimal_transitions: List[Transition] = []
-    seen_transitions: Set[Tuple[str, str, str]] = set()
-    
-    for partition in partitions:
-        # Pick any representative state from the partition
-        representative = next(iter(partition))
-        from_state_name = partition_to_name[partition]
-        
-        for symbol in original_dfa.alphabet:
-            # Find where representative goes on this symbol
-            target = transitions_dict.get((representative, symbol))
-            
-            if target:
-                target_partition = state_to_partition[target]
-                to_state_name = partition_to_name[target_partition]
-                
-                # Add transition if not already added
-                trans_tuple = (from_state_name, to_state_name, symbol)
-                if trans_tuple not in seen_transitions:
-                    seen_transitions.add(trans_tuple)
-                    minimal_transitions.append(Transition(
-                        from_state=from_state_name,
-                        to_state=to_state_name,
-                        symbol=symbol
-                    ))
+    for q in representatives:
+        from_state_name = block_name[block_of[q]]
+        for a, symbol in enumerate(compiled.symbols):
+            r = compiled.delta[q][a]
+            if r >= 0:
+                minimal_transitions.append(Transition(
+                    from_state=from_state_name,
+                    to_state=block_name[block_of[r]],
+                    symbol=symbol
+                ))
     
     # Create the minimal DFA
     minimal_dfa = FSA(
-        states=list(partition_to_name.values()),
+        states=list(block_name.values()),
         alphabet=original_dfa.alphabet,
         transitions=minimal_transitions,
-        initial_state=initial_state,
-        accept_states=accept_states
+        initial_state=block_name[block_of[compiled.initial]],
+        accept_states=[
+            block_name[block_of[q]] for q in representatives if compiled.is_accepting(q)
+        ]
     )
     
     return minimal_dfa
@@ -208,23 +187,22 @@ def remove_unreachable_states(dfa: FSA) -> FSA:
     Returns:
         DFA with only reachable states
     """
-    # Find all reachable states using BFS
-    reachable = {dfa.initial_state}
-    queue = [dfa.initial_state]
-    
-    # Build transition map
-    transitions_dict: Dict[Tuple[str, str], str] = {}
-    for trans in dfa.transitions:
-        transitions_dict[(trans.from_state, trans.symbol)] = trans.to_state
+    # Find all reachable states using BFS over the integer transition table
+    compiled = compile_fsa(dfa)
+    seen = [False] * len(compiled.states)
+    queue = deque()
+    if compiled.initial >= 0:
+        seen[compiled.initial] = True
+        queue.append(compiled.initial)
     
     while queue:
-        current = queue.pop(0)
-        
-        for symbol in dfa.alphabet:
-            target = transitions_dict.get((current, symbol))
-            if target and target not in reachable:
-                reachable.add(target)
-                queue.append(target)
+        for r in compiled.delta[queue.popleft()]:
+            if r >= 0 and not seen[r]:
+                seen[r] = True
+                queue.append(r)
+    
+    reachable = {dfa.initial_state}
+    reachable.update(s for q, s in enumerate(compiled.states) if seen[q])
     
     # Filter states, transitions, and accept states
     filtered_states = [s for s in dfa.states if s in reachable]
@@ -262,13 +240,6 @@ def are_equivalent_dfas(dfa1: FSA, dfa2: FSA) -> bool:
     """
     Check if two DFAs accept the same language.
     
-    Algorithm:
-    1. Minimize both DFAs
-    2. Check if the minimal DFAs are isomorphic
-    
-    Note: This is a basic implementation. More sophisticated
-    approaches exist for language equivalence checking.
-    
     Args:
         dfa1: First DFA
         dfa2: Second DFA
@@ -280,15 +251,57 @@ def are_equivalent_dfas(dfa1: FSA, dfa2: FSA) -> bool:
     if set(dfa1.alphabet) != set(dfa2.alphabet):
         return False
     
-    # Minimize both
-    min1 = minimize_dfa(dfa1)
-    min2 = minimize_dfa(dfa2)
+    return dfas_equivalent(dfa1, dfa2)
+
+
+def dfas_equivalent(dfa1: FSA, dfa2: FSA) -> bool:
+    """
+    Hopcroft-Karp equivalence check for two DFAs over the same alphabet.
+    
+    Merges the states of both DFAs with union-find, starting from the pair
+    of initial states and following each symbol in lockstep; the DFAs are
+    equivalent iff no merged pair disagrees on acceptance. Runs in near
+    O((n1 + n2) * |alphabet|) with no minimization. Missing transitions go
+    to an implicit dead state on each side, so a partial DFA and one with
+    an explicit dead state compare equal when their languages do.
     
-    # Check if they have the same number of states
-    # (Minimal DFAs for the same language are isomorphic)
-    if len(min1.states) != len(min2.states):
+    Args:
+        dfa1: First DFA
+        dfa2: Second DFA (symbols missing from it act as missing transitions)
+        
+    Returns:
+        True if both DFAs accept the same language
+    """
+    c1 = compile_fsa(dfa1)
+    c2 = compile_fsa(dfa2)
+    if c1.initial < 0 or c2.initial < 0:
         return False
     
-    # TODO: Implement full isomorphism check
-    # For now, this is a heuristic
-    return len(min1.states) == len(min2.states)
+    n1 = len(c1.states)
+    n2 = len(c2.states)
+    dead1 = n1 + n2
+    dead2 = dead1 + 1
+    parent = list(range(n1 + n2 + 2))
+    
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    
+    # Symbol index in dfa1 -> symbol index in dfa2
+    sym_map = [c2.sym_to_idx.get(symbol, -1) for symbol in c1.symbols]
+    
+    stack = [(c1.initial, c2.initial)]
+    while stack:
+        p, q = stack.pop()
+        root_p = find(p if p >= 0 else dead1)
+        root_q = find(n1 + q if q >= 0 else dead2)
+        if root_p == root_q:
+            continue
+        if c1.is_accepting(p) != c2.is_accepting(q):
+            return False
+        parent[root_p] = root_q
+        for a, b in enumerate(sym_map):
+            stack.append((c1.step(p, a), c2.step(q, b)))
+    return True
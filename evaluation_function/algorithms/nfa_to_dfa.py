@@ -5,12 +5,10 @@ Implements the subset construction algorithm to convert an NFA (or ε-NFA)
 to an equivalent DFA.
 """
 
-from typing import Set, Dict, FrozenSet, List, Tuple
-from ..schemas import FSA, Transition
-from .epsilon_closure import (
-    epsilon_closure_set,
-    build_epsilon_transition_map
-)
+from collections import deque
+from typing import Set, Dict, List, Tuple
+from ..schemas import FSA
+from .compiled import compile_nfa
 
 
 def subset_construction(nfa: FSA) -> FSA:
@@ -47,98 +45,56 @@ def subset_construction(nfa: FSA) -> FSA:
         >>> dfa = subset_construction(nfa)
         >>> # DFA will have deterministic transitions
     """
-    # Build ε-transition map
-    epsilon_trans = build_epsilon_transition_map(nfa.transitions)
-    
-    # Build transition function for non-ε symbols
-    nfa_transitions: Dict[Tuple[str, str], Set[str]] = {}
-    for trans in nfa.transitions:
-        # Skip ε-transitions
-        if trans.symbol not in ("ε", "epsilon", ""):
-            key = (trans.from_state, trans.symbol)
-            if key not in nfa_transitions:
-                nfa_transitions[key] = set()
-            nfa_transitions[key].add(trans.to_state)
-    
-    # Initialize DFA construction
-    initial_closure = epsilon_closure_set({nfa.initial_state}, epsilon_trans)
-    initial_state_key = frozenset(initial_closure)
-    
-    # Map from frozenset of NFA states to DFA state name
-    state_mapping: Dict[FrozenSet[str], str] = {}
-    state_counter = 0
-    
-    def get_dfa_state_name(nfa_state_set: FrozenSet[str]) -> str:
-        """Get or create a DFA state name for a set of NFA states."""
-        nonlocal state_counter
-        if nfa_state_set not in state_mapping:
-            state_mapping[nfa_state_set] = f"q{state_counter}"
-            state_counter += 1
-        return state_mapping[nfa_state_set]
-    
-    # Track which DFA states we've processed
-    unprocessed_states = [initial_state_key]
-    processed_states: Set[FrozenSet[str]] = set()
-    dfa_transitions: List[Transition] = []
-    
-    # Get initial DFA state name
-    initial_dfa_state = get_dfa_state_name(initial_state_key)
-    
+    # Subsets of NFA states are int bitsets, with ε-closures folded into
+    # the step table, so a DFA transition is one OR over the set bits.
+    # Transitions touching undeclared states or symbols are ignored.
+    compiled = compile_nfa(nfa)
+    symbols = list(compiled.sym_to_idx)
+
+    # DFA state names, by NFA subset, in order of discovery. A subset is
+    # named when first reached and queued only then, so each one is
+    # expanded exactly once
+    names: Dict[int, str] = {compiled.initial_mask: "q0"}
+    unprocessed_states = deque([compiled.initial_mask])
+    dfa_transitions: List[Dict[str, str]] = []
+
     # Process each DFA state
     while unprocessed_states:
-        current_nfa_set = unprocessed_states.pop()
-        
-        if current_nfa_set in processed_states:
-            continue
-        
-        processed_states.add(current_nfa_set)
-        current_dfa_state = get_dfa_state_name(current_nfa_set)
-        
-        # For each symbol in the alphabet
-        for symbol in nfa.alphabet:
-            # Find all NFA states reachable from current set on this symbol
-            reachable_states: Set[str] = set()
-            
-            for nfa_state in current_nfa_set:
-                key = (nfa_state, symbol)
-                if key in nfa_transitions:
-                    reachable_states |= nfa_transitions[key]
-            
-            # Compute ε-closure of reachable states
-            if reachable_states:
-                closure = epsilon_closure_set(reachable_states, epsilon_trans)
-                next_state_key = frozenset(closure)
-                next_dfa_state = get_dfa_state_name(next_state_key)
-                
-                # Add DFA transition
-                dfa_transitions.append(Transition(
-                    from_state=current_dfa_state,
-                    to_state=next_dfa_state,
-                    symbol=symbol
-                ))
-                
-                # Add to unprocessed if not seen before
-                if next_state_key not in processed_states:
-                    unprocessed_states.append(next_state_key)
-    
-    # Determine accepting states
+        current = unprocessed_states.popleft()
+        current_dfa_state = names[current]
+
+        # For each symbol in the alphabet, the ε-closed set of NFA states
+        # reachable from the current set
+        for a, symbol in enumerate(symbols):
+            reachable = compiled.move(current, a)
+            if not reachable:
+                continue
+
+            next_dfa_state = names.get(reachable)
+            if next_dfa_state is None:
+                next_dfa_state = names[reachable] = f"q{len(names)}"
+                unprocessed_states.append(reachable)
+
+            dfa_transitions.append({
+                "from_state": current_dfa_state,
+                "to_state": next_dfa_state,
+                "symbol": symbol,
+            })
+
     # A DFA state is accepting if it contains any NFA accepting state
-    nfa_accept_states = set(nfa.accept_states)
-    dfa_accept_states = []
-    
-    for nfa_state_set, dfa_state_name in state_mapping.items():
-        if nfa_state_set & nfa_accept_states:  # Intersection check
-            dfa_accept_states.append(dfa_state_name)
-    
+    dfa_accept_states = [
+        name for subset, name in names.items() if subset & compiled.accept_mask
+    ]
+
     # Build the DFA
     dfa = FSA(
-        states=list(state_mapping.values()),
+        states=list(names.values()),
         alphabet=nfa.alphabet,
         transitions=dfa_transitions,
-        initial_state=initial_dfa_state,
+        initial_state="q0",
         accept_states=dfa_accept_states
     )
-    
+
     return dfa
 
 
@@ -0,0 +1,98 @@
+"""
+Refinable Partition
+
+Array-based partition of {0, ..., n-1} supporting "mark some elements,
+then split every set into its marked and unmarked parts", after Valmari &
+Lehtinen / Valmari, "Fast brief practical DFA minimization" (2012).
+
+Each set occupies a contiguous slice of one element array, so a split is
+a pointer move plus relabeling the moved elements: O(marked) time and no
+per-split allocation, unlike refinement with Python sets.
+"""
+
+from typing import List, Tuple
+
+
+class RefinablePartition:
+    """
+    Partition of the integers 0..n-1 into numbered sets.
+
+    Attributes:
+        elems: Elements, grouped so each set is the slice elems[first[s]:past[s]]
+        loc: loc[e] is the position of element e in elems
+        set_of: set_of[e] is the set containing element e
+        first: first[s] is where set s starts in elems
+        past: past[s] is one past where set s ends in elems
+        marked: marked[s] is how many elements of s are marked; the marked
+            ones sit at the front of the slice
+    """
+
+    def __init__(self, n: int):
+        self.elems: List[int] = list(range(n))
+        self.loc: List[int] = list(range(n))
+        self.set_of: List[int] = [0] * n
+        self.first: List[int] = [0] if n else []
+        self.past: List[int] = [n] if n else []
+        self.marked: List[int] = [0] if n else []
+        self._touched: List[int] = []
+
+    @property
+    def set_count(self) -> int:
+        return len(self.first)
+
+    def size(self, s: int) -> int:
+        return self.past[s] - self.first[s]
+
+    def members(self, s: int) -> List[int]:
+        return self.elems[self.first[s]:self.past[s]]
+
+    def mark(self, e: int) -> None:
+        """Mark element e for the next split (marking twice is a no-op)."""
+        s = self.set_of[e]
+        i = self.loc[e]
+        j = self.first[s] + self.marked[s]
+        if i < j:
+            return
+        # Swap e into the marked prefix of its set
+        elems, loc = self.elems, self.loc
+        other = elems[j]
+        elems[i], elems[j] = other, e
+        loc[other], loc[e] = i, j
+        if self.marked[s] == 0:
+            self._touched.append(s)
+        self.marked[s] += 1
+
+    def split(self) -> List[Tuple[int, int]]:
+        """
+        Split every set with marks into its marked and unmarked parts.
+
+        The smaller part becomes a new set; sets whose elements were all
+        marked are left whole. All marks are cleared.
+
+        Returns:
+            (old set, new set) for every split performed
+        """
+        splits: List[Tuple[int, int]] = []
+        for s in self._touched:
+            mid = self.first[s] + self.marked[s]
+            self.marked[s] = 0
+            if mid == self.past[s]:
+                continue
+
+            new = len(self.first)
+            if mid - self.first[s] <= self.past[s] - mid:
+                # Marked part is smaller: it becomes the new set
+                self.first.append(self.first[s])
+                self.past.append(mid)
+                self.first[s] = mid
+            else:
+                self.first.append(mid)
+                self.past.append(self.past[s])
+                self.past[s] = mid
+            self.marked.append(0)
+
+            for i in range(self.first[new], self.past[new]):
+                self.set_of[self.elems[i]] = new
+            splits.append((s, new))
+        self._touched.clear()
+        return splits
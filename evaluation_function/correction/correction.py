@@ -7,12 +7,13 @@ Returns Result with FSAFeedback for UI highlighting.
 All detailed "why" feedback comes from are_isomorphic() in validation module.
 """
 
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 
 from evaluation_function.schemas.params import Params
 
 # Schema imports
-from ..schemas import FSA, ValidationError, ErrorCode, ValidationResult
+from ..schemas import FSA, ValidationError
 from ..schemas.result import Result, FSAFeedback, StructuralInfo, LanguageComparison
 
 # Validation imports
@@ -44,7 +45,7 @@ def _build_feedback(
     errors = [e for e in all_errors if e.severity == "error"]
     warnings = [e for e in all_errors if e.severity in ("warning", "info")]
 
-    # Remove UI highlights if disabled
+    # Validators skip highlights when disabled; equivalence errors still carry them
     if not params.highlight_errors:
         for e in all_errors:
             e.highlight = None
@@ -83,20 +84,39 @@ def _build_feedback(
     )
 
 
+def _error_key(error: ValidationError) -> Tuple:
+    """Identity of an error for de-duplication: what it says and where."""
+    h = error.highlight
+    where = (h.type, h.state_id, h.from_state, h.to_state, h.symbol) if h else None
+    return (error.code, error.message, where)
+
+
+# Checked in order; the first keyword found in a message decides its category
+_SUMMARY_CATEGORIES = (
+    ("alphabet", "alphabet issue"),
+    ("accept", "accepting states issue"),
+    ("transition", "transition issue"),
+    ("state", "state structure issue"),
+)
+# One scan per message for every keyword; the table order decides ties
+_SUMMARY_KEYWORDS = re.compile(
+    "|".join(keyword for keyword, _ in _SUMMARY_CATEGORIES), re.IGNORECASE
+)
+_KEYWORD_RANK = {keyword: rank for rank, (keyword, _) in enumerate(_SUMMARY_CATEGORIES)}
+
+
 def _summarize_errors(errors: List[ValidationError]) -> str:
     """Generate a human-readable summary from error messages."""
-    categories = set()
+    # Dict as an ordered set: categories are listed in first-seen order
+    categories: Dict[str, None] = {}
 
     for error in errors:
-        msg = error.message.lower()
-        if "alphabet" in msg:
-            categories.add("alphabet issue")
-        elif "accept" in msg:
-            categories.add("accepting states issue")
-        elif "transition" in msg:
-            categories.add("transition issue")
-        elif "state" in msg:
-            categories.add("state structure issue")
+        found = _SUMMARY_KEYWORDS.findall(error.message)
+        if found:
+            rank = min(_KEYWORD_RANK[keyword.lower()] for keyword in found)
+            categories[_SUMMARY_CATEGORIES[rank][1]] = None
+        if len(categories) == len(_SUMMARY_CATEGORIES):
+            break  # every category already found
 
     if len(categories) == 1:
         return f"Almost there! Your FSA has a {next(iter(categories))}."
@@ -125,7 +145,7 @@ def analyze_fsa_correction(
     # -------------------------------------------------------------------------
     # Step 1: Validate student FSA structure
     # -------------------------------------------------------------------------
-    student_result = is_valid_fsa(student_fsa)
+    student_result = is_valid_fsa(student_fsa, params.highlight_errors)
     if not student_result.ok:
         summary = (
             "Your FSA has a structural problem that needs to be fixed first."
@@ -147,7 +167,7 @@ def analyze_fsa_correction(
     # -------------------------------------------------------------------------
     # Step 2: Validate expected FSA (should never fail)
     # -------------------------------------------------------------------------
-    expected_result = is_valid_fsa(expected_fsa)
+    expected_result = is_valid_fsa(expected_fsa, include_highlights=False)
     if not expected_result.ok:
         return Result(
             is_correct=False,
@@ -158,7 +178,7 @@ def analyze_fsa_correction(
     # Step 3: Enforce expected automaton type
     # -------------------------------------------------------------------------
     if params.expected_type == "DFA":
-        det_result = is_deterministic(student_fsa)
+        det_result = is_deterministic(student_fsa, params.highlight_errors)
         if not det_result.ok:
             summary = "Your automaton must be deterministic (a DFA)."
             return Result(
@@ -177,7 +197,7 @@ def analyze_fsa_correction(
     # Step 4: Optional completeness check
     # -------------------------------------------------------------------------
     if params.check_completeness:
-        comp_result = is_complete(student_fsa)
+        comp_result = is_complete(student_fsa, params.highlight_errors)
         if not comp_result.ok:
             validation_errors.extend(comp_result.errors)
 
@@ -207,7 +227,14 @@ def analyze_fsa_correction(
     # Step 8: Isomorphism
     # -------------------------------------------------------------------------
     iso_result = are_isomorphic(student_fsa, expected_fsa)
-    equivalence_errors.extend(iso_result.errors)
+    # When the student's FSA is already minimal, both passes describe the
+    # same elements; report each distinct error once
+    seen = {_error_key(e) for e in equivalence_errors}
+    for e in iso_result.errors:
+        key = _error_key(e)
+        if key not in seen:
+            seen.add(key)
+            equivalence_errors.append(e)
 
     # -------------------------------------------------------------------------
     # Step 9: Decide correctness based on evaluation mode
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Tuple
 from lf_toolkit.evaluation import Result as LFResult
 
@@ -7,11 +8,61 @@ from .schemas.result import FSAFeedback, Result
 from .correction import analyze_fsa_correction
 import json
 
-def validate_fsa(value: str | dict) -> Tuple[FSA, Params]:
-    """Parse a FSA from JSON string or dict."""
-    if isinstance(value, str):
-        return FSAFrontend.model_validate_json(value).toFSA()
-    return FSAFrontend.model_validate(value).toFSA(), Params.model_validate_json(FSAFrontend.model_validate(value).config)
+def validate_fsa(value: str | bytes | dict) -> Tuple[FSA, Params]:
+    """Parse a FSA and its config from JSON string/bytes or dict."""
+    if isinstance(value, (str, bytes)):
+        # Straight to pydantic-core's JSON parser, no intermediate dict
+        frontend = FSAFrontend.model_validate_json(value)
+    else:
+        frontend = FSAFrontend.model_validate(value)
+    return frontend.toFSA(), Params.model_validate_json(frontend.config)
+
+
+@lru_cache(maxsize=128)
+def _parse_frontend(payload: str) -> FSAFrontend:
+    """Validate a JSON FSA payload; cached since answers and resubmissions repeat."""
+    return FSAFrontend.model_validate_json(payload)
+
+
+def _parse_answer(answer_key: str) -> Tuple[FSA, Params]:
+    """Build a fresh expected FSA and its config from the answer key."""
+    frontend = _parse_frontend(answer_key)
+    return frontend.toFSA(), Params.model_validate_json(frontend.config)
+
+
+def _parse_response(response: str) -> FSA:
+    """Build a fresh FSA from a JSON student response."""
+    return _parse_frontend(response).toFSA()
+
+
+def _answer_key(answer: str | dict) -> str:
+    """Canonical JSON key for an answer payload."""
+    if isinstance(answer, str):
+        return answer
+    return json.dumps(answer, sort_keys=True)
+
+
+def _feedback_json(feedback: FSAFeedback) -> str:
+    """Serialize feedback for the frontend, leaving out unset (None) fields."""
+    return feedback.model_dump_json(exclude_none=True)
+
+
+def _get(obj: Any, key: str) -> Any:
+    """Read a field from a dict payload or an attribute-style object."""
+    return obj.get(key) if isinstance(obj, dict) else getattr(obj, key, None)
+
+
+def _extract_args(response: Any, answer: Any, params: Any) -> Tuple[Any, Any, Any]:
+    """
+    Resolve (response, answer, params) for both call shapes: separate
+    arguments, or the whole payload wrapped in params.
+
+    Only a missing (None) argument triggers the fallback, so an explicit
+    empty payload is parsed (and rejected) as given.
+    """
+    if response is not None and answer is not None:
+        return response, answer, params
+    return _get(params, "response"), _get(params, "answer"), _get(params, "params")
 
 def evaluation_function(
     response: Any = None,
@@ -30,17 +81,14 @@ def evaluation_function(
         LFResult with is_correct and feedback_items
     """
     try:
-        if not response or not answer:
-            response = params.get("response") if isinstance(params, dict) else None
-            answer = params.get("answer") if isinstance(params, dict) else None
-            params = params.get("params") if isinstance(params, dict) else None
-            # raise ValueError(
-            #     f"Missing FSA data: response or answer is None\n"
-            #     f"response: {response}\nanswer: {answer}"
-            # )
+        response, answer, params = _extract_args(response, answer, params)
+
         # Parse FSAs
-        student_fsa, _ = validate_fsa(response)
-        expected_fsa, expected_config = validate_fsa(answer)
+        if isinstance(response, str):
+            student_fsa = _parse_response(response)
+        else:
+            student_fsa, _ = validate_fsa(response)
+        expected_fsa, expected_config = _parse_answer(_answer_key(answer))
 
         # Run correction pipeline
         result: Result = analyze_fsa_correction(student_fsa, expected_fsa, expected_config)
@@ -48,22 +96,15 @@ def evaluation_function(
         # Return LFResult
         return LFResult(
             is_correct=result.is_correct,
-            feedback_items=[("errors", result.fsa_feedback.model_dump_json())]
+            feedback_items=[("errors", _feedback_json(result.fsa_feedback))]
         )
 
     except Exception as e:
-        result: Result = Result(
-            is_correct=False,
-            feedback=f"Error during evaluation: {str(e)}",
-            fsa_feedback=FSAFeedback(
-                summary=f"Error during evaluation: {str(e)}, answer: {answer}, response: {response} params: {params}",
-                errors=[]
-            )
+        feedback = FSAFeedback(
+            summary=f"Error during evaluation: {str(e)}, answer: {answer}, response: {response} params: {params}",
+            errors=[]
         )
         return LFResult(
             is_correct=False,
-            feedback_items=[(
-                "error",
-                result.fsa_feedback.model_dump_json()
-            )]
+            feedback_items=[("error", _feedback_json(feedback))]
         )
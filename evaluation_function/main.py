@@ -11,7 +11,7 @@ import json
 from typing import Any, Dict
 
 from lf_toolkit import create_server, run
-from lf_toolkit.evaluation import Params, Result as LFResult
+from lf_toolkit.evaluation import Params
 
 from .evaluation import evaluation_function
 from .preview import preview_function
@@ -92,9 +92,10 @@ def handle_file_based_communication(input_path: str, output_path: str) -> None:
             'feedback': f'Error processing request: {str(e)}'
         }
     
-    # Write output to file
+    # Write output to file (json.dumps uses the C encoder; json.dump
+    # streams through the pure-Python one chunk by chunk)
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(response_data, f, ensure_ascii=False)
+        f.write(json.dumps(response_data, ensure_ascii=False))
 
 
 def main():
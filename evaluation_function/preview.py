@@ -23,6 +23,15 @@ from .validation.validation import (
     get_structured_info_of_fsa,
 )
 
+# Feedback for pydantic validation errors, by the first field named in the
+# (lowercased) message; checked in order
+_PARSE_HINTS = (
+    ("states", "Your FSA is missing the 'states' list. Every FSA needs a set of states to define!"),
+    ("alphabet", "Your FSA is missing the 'alphabet'. What symbols should your automaton recognize?"),
+    ("initial_state", "Your FSA needs an initial state - this is where processing begins!"),
+    ("transitions", "There's an issue with your transitions. Each transition needs a from_state, to_state, and symbol."),
+)
+
 
 def parse_fsa(value: Any) -> FSA:
     """
@@ -63,40 +72,51 @@ def format_errors_for_preview(errors: List[ValidationError], max_errors: int = 5
     if not errors:
         return ""
     
-    # Separate errors by severity
-    critical_errors = [e for e in errors if e.severity == "error"]
-    warnings = [e for e in errors if e.severity == "warning"]
+    # Separate errors by severity in one pass, keeping only the ones shown
+    critical_errors: List[ValidationError] = []
+    warnings: List[ValidationError] = []
+    n_critical = n_warnings = 0
+    for e in errors:
+        severity = e.severity
+        if severity == "error":
+            if n_critical < max_errors:
+                critical_errors.append(e)
+            n_critical += 1
+        elif severity == "warning":
+            if n_warnings < max_errors:
+                warnings.append(e)
+            n_warnings += 1
     
     lines = []
     
-    if critical_errors:
-        if len(critical_errors) == 1:
+    if n_critical:
+        if n_critical == 1:
             lines.append("There's an issue with your FSA that needs to be fixed:")
         else:
-            lines.append(f"There are {len(critical_errors)} issues with your FSA that need to be fixed:")
+            lines.append(f"There are {n_critical} issues with your FSA that need to be fixed:")
         lines.append("")
         
-        for i, err in enumerate(critical_errors[:max_errors], 1):
+        for i, err in enumerate(critical_errors, 1):
             lines.append(f"  {i}. {err.message}")
             if err.suggestion:
                 lines.append(f"     >> {err.suggestion}")
             lines.append("")
         
-        if len(critical_errors) > max_errors:
-            lines.append(f"  ... and {len(critical_errors) - max_errors} more issue(s)")
+        if n_critical > max_errors:
+            lines.append(f"  ... and {n_critical - max_errors} more issue(s)")
     
-    if warnings:
+    if n_warnings:
         if lines:
             lines.append("")
         lines.append("Some things to consider (not blocking, but worth checking):")
         lines.append("")
-        for i, warn in enumerate(warnings[:max_errors], 1):
+        for warn in warnings:
             lines.append(f"  - {warn.message}")
             if warn.suggestion:
                 lines.append(f"    >> {warn.suggestion}")
         
-        if len(warnings) > max_errors:
-            lines.append(f"  ... and {len(warnings) - max_errors} more suggestion(s)")
+        if n_warnings > max_errors:
+            lines.append(f"  ... and {n_warnings - max_errors} more suggestion(s)")
     
     return "\n".join(lines)
 
@@ -105,16 +125,7 @@ def errors_to_dict_list(errors: List[ValidationError]) -> List[Dict]:
     """
     Convert ValidationError objects to dictionaries for JSON serialization.
     """
-    return [
-        {
-            "message": e.message,
-            "code": e.code.value if hasattr(e.code, 'value') else str(e.code),
-            "severity": e.severity,
-            "highlight": e.highlight.model_dump() if e.highlight else None,
-            "suggestion": e.suggestion
-        }
-        for e in errors
-    ]
+    return [e.to_dict() for e in errors]
 
 
 def preview_function(response: Any, params: Params) -> Result:
@@ -154,22 +165,17 @@ def preview_function(response: Any, params: Params) -> Result:
     except Exception as e:
         # Failed to parse - this is a critical error
         error_msg = str(e)
+        msg_low = error_msg.lower()
         
         # Make error message more user-friendly
-        if "validation error" in error_msg.lower():
-            if "states" in error_msg.lower():
-                feedback = "Your FSA is missing the 'states' list. Every FSA needs a set of states to define!"
-            elif "alphabet" in error_msg.lower():
-                feedback = "Your FSA is missing the 'alphabet'. What symbols should your automaton recognize?"
-            elif "initial_state" in error_msg.lower():
-                feedback = "Your FSA needs an initial state - this is where processing begins!"
-            elif "transitions" in error_msg.lower():
-                feedback = "There's an issue with your transitions. Each transition needs a from_state, to_state, and symbol."
-            else:
-                feedback = f"Your FSA structure isn't quite right: {error_msg}"
-        elif "json" in error_msg.lower():
+        if "validation error" in msg_low:
+            feedback = next(
+                (hint for field, hint in _PARSE_HINTS if field in msg_low),
+                f"Your FSA structure isn't quite right: {error_msg}",
+            )
+        elif "json" in msg_low:
             feedback = "Couldn't read your FSA data. Make sure it's properly formatted."
-        elif "no fsa" in error_msg.lower() or "none" in error_msg.lower():
+        elif "no fsa" in msg_low or "none" in msg_low:
             feedback = "No FSA provided! Please build your automaton before checking."
         else:
             feedback = f"There's a problem with your FSA format: {error_msg}"
@@ -189,11 +195,11 @@ def preview_function(response: Any, params: Params) -> Result:
     all_errors: List[ValidationError] = []
     
     # Run structural validation (states, initial, accept, transitions)
-    structural_errors = is_valid_fsa(fsa)
-    all_errors.extend(structural_errors)
+    structural = is_valid_fsa(fsa)
+    all_errors.extend(structural.errors)
     
     # If there are structural errors, don't proceed with other checks
-    if structural_errors:
+    if not structural.ok:
         feedback = "Your FSA has some issues that need to be fixed before submission.\n\n"
         feedback += format_errors_for_preview(all_errors)
         return Result(
@@ -211,28 +217,31 @@ def preview_function(response: Any, params: Params) -> Result:
     # Step 3: Additional checks (determinism, unreachable states, dead states)
     warnings: List[ValidationError] = []
     
-    # Check determinism if required
-    if require_deterministic:
-        det_errors = is_deterministic(fsa)
-        if det_errors:
-            all_errors.extend(det_errors)
+    # Check determinism if required (reused below if structural info fails)
+    determinism = is_deterministic(fsa) if require_deterministic else None
+    if determinism is not None:
+        all_errors.extend(determinism.errors)
     
     # Check for warnings (unreachable/dead states)
     if show_warnings:
-        unreachable = find_unreachable_states(fsa)
-        dead = find_dead_states(fsa)
-        warnings.extend(unreachable)
-        warnings.extend(dead)
+        warnings.extend(find_unreachable_states(fsa).errors)
+        warnings.extend(find_dead_states(fsa).errors)
     
-    # Get structural info
-    try:
-        info = get_structured_info_of_fsa(fsa)
-        info_dict = info.model_dump()
-    except Exception:
+    # Get structural info; the error response only reports the counts, so
+    # the full analysis is skipped there
+    info_dict = None
+    if not all_errors:
+        try:
+            info_dict = get_structured_info_of_fsa(fsa).model_dump()
+        except Exception:
+            pass
+    if info_dict is None:
+        if determinism is None:
+            determinism = is_deterministic(fsa)
         info_dict = {
             "num_states": len(fsa.states),
             "num_transitions": len(fsa.transitions),
-            "is_deterministic": len(is_deterministic(fsa)) == 0
+            "is_deterministic": determinism.ok
         }
     
     # Step 4: Build response
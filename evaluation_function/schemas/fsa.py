@@ -5,7 +5,7 @@ Defines the structure for Finite State Automata passed as student response.
 """
 
 from typing import List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Transition(BaseModel):
@@ -69,8 +69,8 @@ class FSA(BaseModel):
         description="F: Set of accepting/final states"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "states": ["q0", "q1", "q2"],
                 "alphabet": ["a", "b"],
@@ -82,6 +82,7 @@ class FSA(BaseModel):
                 "accept_states": ["q2"]
             }
         }
+    )
 
 
 
@@ -1,7 +1,10 @@
 from typing import List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from .fsa import FSA, Transition
 
+# Validates a whole transition list in one pydantic-core call
+_TRANSITION_LIST_ADAPTER = TypeAdapter(List[Transition])
+
 # frontend zod restricts typing, this is the current workaround
 
 class FSAFrontend(BaseModel):
@@ -70,7 +73,10 @@ class FSAFrontend(BaseModel):
     #     }
 
     def toFSA(self) -> FSA:
-        transitions: List[Transition] = []
+        # Name -> stored string, so parsed names reuse the same string objects
+        states = {s: s for s in self.states}
+        alphabet = {a: a for a in self.alphabet}
+        transitions: List[dict] = []
 
         for t in self.transitions:
             parts = t.split("|")
@@ -85,36 +91,40 @@ class FSAFrontend(BaseModel):
                     "Expected 'from|symbol|to'"
                 )
 
-            from_state, symbol, to_state = parts
+            from_name, symbol_name, to_name = parts
 
-            if from_state not in self.states:
-                raise ValueError(f"Unknown from_state '{from_state}'")
+            from_state = states.get(from_name)
+            if from_state is None:
+                raise ValueError(f"Unknown from_state '{from_name}'")
 
-            if to_state not in self.states:
-                raise ValueError(f"Unknown to_state '{to_state}'")
+            to_state = states.get(to_name)
+            if to_state is None:
+                raise ValueError(f"Unknown to_state '{to_name}'")
 
-            if symbol not in self.alphabet:
-                raise ValueError(f"Symbol '{symbol}' not in alphabet")
+            symbol = alphabet.get(symbol_name)
+            if symbol is None:
+                raise ValueError(f"Symbol '{symbol_name}' not in alphabet")
 
             transitions.append(
-                Transition(
-                    from_state=from_state,
-                    symbol=symbol,
-                    to_state=to_state,
-                )
+                {
+                    "from_state": from_state,
+                    "symbol": symbol,
+                    "to_state": to_state,
+                }
             )
 
-        if self.initial_state not in self.states:
+        if self.initial_state not in states:
             raise ValueError("initial_state must be in states")
 
-        for s in self.accept_states:
-            if s not in self.states:
-                raise ValueError(f"Accept state '{s}' not in states")
+        if not states.keys() >= set(self.accept_states):
+            s = next(s for s in self.accept_states if s not in states)
+            raise ValueError(f"Accept state '{s}' not in states")
 
-        return FSA(
-            states=self.states,
-            alphabet=self.alphabet,
-            transitions=transitions,
+        # Fields are already validated here; transitions in one batched call
+        return FSA.model_construct(
+            states=list(self.states),
+            alphabet=list(self.alphabet),
+            transitions=_TRANSITION_LIST_ADAPTER.validate_python(transitions),
             initial_state=self.initial_state,
-            accept_states=self.accept_states,
+            accept_states=list(self.accept_states),
         )
\ No newline at end of file
@@ -4,12 +4,9 @@ Result Schema
 Extended result schema with structured feedback for UI highlighting.
 """
 
-from typing import List, Optional, Literal, TypeVar, Generic
+from typing import Any, Dict, List, Optional, Literal, TypeVar, Generic
 from enum import Enum
 from pydantic import BaseModel, Field
-from pydantic.generics import GenericModel
-
-from evaluation_function.schemas.fsa import FSA
 
 
 class ErrorCode(str, Enum):
@@ -83,6 +80,16 @@ class ElementHighlight(BaseModel):
         description="Transition symbol (for type='transition' or 'alphabet_symbol')"
     )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Same as model_dump(), read straight off the attributes."""
+        return {
+            "type": self.type,
+            "state_id": self.state_id,
+            "from_state": self.from_state,
+            "to_state": self.to_state,
+            "symbol": self.symbol,
+        }
+
 
 class ValidationError(BaseModel):
     """
@@ -136,10 +143,25 @@ class ValidationError(BaseModel):
         description="Actionable suggestion for fixing the error"
     )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Same as model_dump(mode="json"), read straight off the attributes.
+
+        These models are flat, so this skips the serializer walk that
+        dominates when dumping dozens of errors.
+        """
+        return {
+            "message": self.message,
+            "code": self.code.value if hasattr(self.code, "value") else str(self.code),
+            "severity": self.severity,
+            "highlight": self.highlight.to_dict() if self.highlight else None,
+            "suggestion": self.suggestion,
+        }
+
 T = TypeVar("T")
 
 
-class ValidationResult(GenericModel, Generic[T]):
+class ValidationResult(BaseModel, Generic[T]):
     value: Optional[T] = None
     errors: List[ValidationError] = []
 
@@ -1,14 +1,13 @@
-from .fsa import FSA, Transition
+from .fsa import FSA
 
 
 
 def make_fsa(states, alphabet, transitions, initial, accept):
+    # Transition dicts are validated by FSA in one pass, not one model at a time
     return FSA(
         states=states,
         alphabet=alphabet,
-        transitions=[
-            Transition(**t) for t in transitions
-        ],
+        transitions=transitions,
         initial_state=initial,
         accept_states=accept,
     )
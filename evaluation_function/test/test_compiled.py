@@ -0,0 +1,96 @@
+"""
+Tests for the compiled (integer-interned) FSA representation.
+"""
+
+from evaluation_function.algorithms.compiled import (
+    compile_fsa,
+    compile_nfa,
+    transition_columns,
+)
+
+
+class TestCompileFsa:
+    """Test compile_fsa function."""
+
+    def test_states_and_symbols_interned(self, simple_dfa):
+        """Test that states and symbols get contiguous indices."""
+        compiled = compile_fsa(simple_dfa)
+
+        assert compiled.states == ["q0", "q1"]
+        assert compiled.symbols == ["a", "b"]
+        assert compiled.state_to_idx == {"q0": 0, "q1": 1}
+        assert compiled.initial == 0
+
+    def test_delta_table(self, simple_dfa):
+        """Test that the delta table mirrors the transitions."""
+        compiled = compile_fsa(simple_dfa)
+        a = compiled.sym_to_idx["a"]
+        b = compiled.sym_to_idx["b"]
+
+        assert compiled.step(0, a) == 1
+        assert compiled.step(0, b) == 0
+        assert compiled.step(1, a) == 1
+
+    def test_accept_mask(self, simple_dfa):
+        """Test that accepting states are encoded in the bitmask."""
+        compiled = compile_fsa(simple_dfa)
+
+        assert not compiled.is_accepting(0)
+        assert compiled.is_accepting(1)
+        assert not compiled.is_accepting(-1)
+
+    def test_step_from_missing_state(self, minimizable_dfa):
+        """Test that stepping from or on an unknown index yields -1."""
+        compiled = compile_fsa(minimizable_dfa)
+
+        assert compiled.step(-1, 0) == -1
+        assert compiled.step(0, -1) == -1
+
+    def test_epsilon_not_interned(self, epsilon_nfa):
+        """Test that epsilon transitions do not enter the delta table."""
+        compiled = compile_fsa(epsilon_nfa)
+
+        assert "ε" not in compiled.sym_to_idx
+        assert all(dst == -1 for dst in compiled.delta[0])
+
+
+class TestCompileNfa:
+    """Test compile_nfa function."""
+
+    def test_initial_mask_is_epsilon_closed(self, epsilon_nfa):
+        """Test that the initial mask includes ε-reachable states."""
+        nfa = compile_nfa(epsilon_nfa)
+
+        assert nfa.initial_mask == 0b011
+        assert nfa.accept_mask == 0b100
+
+    def test_move_follows_all_branches(self, simple_nfa):
+        """Test that a move unions the destinations of every set bit."""
+        nfa = compile_nfa(simple_nfa)
+        a = nfa.sym_to_idx["a"]
+
+        assert nfa.move(nfa.initial_mask, a) == 0b11
+        assert nfa.move(0b10, a) == 0
+
+    def test_step_includes_epsilon_closure(self, epsilon_nfa):
+        """Test that destinations are ε-closed in the step table."""
+        nfa = compile_nfa(epsilon_nfa)
+        a = nfa.sym_to_idx["a"]
+
+        assert nfa.move(nfa.initial_mask, a) == 0b100
+
+
+class TestTransitionColumns:
+    """Test transition_columns function."""
+
+    def test_columns_aligned(self, simple_dfa):
+        """Test that the columns line up with the transition list."""
+        froms, symbols, tos = transition_columns(simple_dfa.transitions)
+
+        assert len(froms) == len(symbols) == len(tos) == len(simple_dfa.transitions)
+        for i, t in enumerate(simple_dfa.transitions):
+            assert (froms[i], symbols[i], tos[i]) == (t.from_state, t.symbol, t.to_state)
+
+    def test_no_transitions(self):
+        """Test that an empty transition list yields empty columns."""
+        assert transition_columns([]) == ((), (), ())
@@ -10,6 +10,7 @@ from evaluation_function.schemas.utils import make_fsa
 from evaluation_function.schemas.result import Result, FSAFeedback
 from evaluation_function.schemas.params import Params
 from evaluation_function.correction import analyze_fsa_correction
+from evaluation_function.correction.correction import _summarize_errors
 
 
 # =============================================================================
@@ -124,6 +125,65 @@ class TestAnalyzeFsaCorrection:
         assert result.fsa_feedback is not None
         assert len(result.fsa_feedback.errors) > 0
 
+    def test_shared_error_reported_once(self):
+        # Both the language and the structure comparison flag the missing
+        # b-transition; the student sees it once, not twice
+        student = make_fsa(
+            states=["q0", "q1"],
+            alphabet=["a", "b"],
+            transitions=[
+                {"from_state": "q0", "to_state": "q1", "symbol": "a"},
+                {"from_state": "q1", "to_state": "q1", "symbol": "a"},
+            ],
+            initial="q0",
+            accept=["q1"],
+        )
+        expected = make_fsa(
+            states=["q0", "q1"],
+            alphabet=["a", "b"],
+            transitions=[
+                {"from_state": "q0", "to_state": "q1", "symbol": "a"},
+                {"from_state": "q1", "to_state": "q1", "symbol": "a"},
+                {"from_state": "q1", "to_state": "q1", "symbol": "b"},
+            ],
+            initial="q0",
+            accept=["q1"],
+        )
+        result = analyze_fsa_correction(student, expected, Params())
+        assert [e.message for e in result.fsa_feedback.errors] == [
+            "Missing or extra transition from state 'q1' on symbol 'b'."
+        ]
+
+    def test_structure_only_errors_kept(self):
+        # Same language, one redundant state: only the structure comparison
+        # reports it, and de-duplication must not drop it
+        student = make_fsa(
+            states=["q0", "q1", "q2"],
+            alphabet=["a"],
+            transitions=[
+                {"from_state": "q0", "to_state": "q1", "symbol": "a"},
+                {"from_state": "q1", "to_state": "q2", "symbol": "a"},
+                {"from_state": "q2", "to_state": "q1", "symbol": "a"},
+            ],
+            initial="q0",
+            accept=["q1", "q2"],
+        )
+        expected = make_fsa(
+            states=["q0", "q1"],
+            alphabet=["a"],
+            transitions=[
+                {"from_state": "q0", "to_state": "q1", "symbol": "a"},
+                {"from_state": "q1", "to_state": "q1", "symbol": "a"},
+            ],
+            initial="q0",
+            accept=["q1"],
+        )
+        result = analyze_fsa_correction(student, expected, Params())
+        assert result.is_correct is True
+        assert [e.message for e in result.fsa_feedback.errors] == [
+            "FSA structure mismatch: expected 2 states, but found 3."
+        ]
+
 
 # =============================================================================
 # Test Invalid FSAs
@@ -335,5 +395,39 @@ class TestEpsilonTransitionCorrection:
         assert result.fsa_feedback.structural.is_deterministic is False
 
 
+# =============================================================================
+# Test Error Summary
+# =============================================================================
+
+class TestSummarizeErrors:
+    """Test the one-line summary built from error messages."""
+
+    def _error(self, message):
+        return ValidationError(message=message, code=ErrorCode.LANGUAGE_MISMATCH)
+
+    def test_single_category(self):
+        summary = _summarize_errors([self._error("Missing transition from 'q0' on 'a'.")])
+        assert summary == "Almost there! Your FSA has a transition issue."
+
+    def test_first_matching_keyword_wins(self):
+        summary = _summarize_errors([self._error("State 'q1' should be an accepting state.")])
+        assert summary == "Almost there! Your FSA has a accepting states issue."
+
+    def test_categories_in_first_seen_order(self):
+        summary = _summarize_errors([
+            self._error("State 'q2' is unreachable."),
+            self._error("The alphabet of your FSA does not match the required alphabet."),
+            self._error("State 'q3' is unreachable."),
+        ])
+        assert summary == "Your FSA has multiple issues: state structure issue, alphabet issue."
+
+    def test_keyword_case_ignored(self):
+        summary = _summarize_errors([self._error("Transition from 'q0' on 'a' leads to the wrong state.")])
+        assert summary == "Almost there! Your FSA has a transition issue."
+
+    def test_no_categories(self):
+        assert _summarize_errors([]) == "Your FSA does not match the expected language."
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
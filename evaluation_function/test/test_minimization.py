@@ -9,8 +9,11 @@ from evaluation_function.algorithms.minimization import (
     hopcroft_minimization,
     minimize_dfa,
     remove_unreachable_states,
-    are_equivalent_dfas
+    are_equivalent_dfas,
+    build_minimal_dfa,
+    hopcroft_partition
 )
+from evaluation_function.algorithms.compiled import compile_fsa
 from evaluation_function.algorithms.nfa_to_dfa import is_deterministic
 from evaluation_function.schemas import FSA, Transition
 
@@ -208,6 +211,63 @@ class TestHopcroftMinimization:
         assert is_deterministic(minimal)
 
 
+class TestHopcroftPartition:
+    """Test hopcroft_partition function."""
+    
+    def test_equivalent_states_share_block(self):
+        """Test that indistinguishable states get the same block id."""
+        dfa = FSA(
+            states=["q0", "q1", "q2"],
+            alphabet=["a"],
+            transitions=[
+                Transition(from_state="q0", to_state="q1", symbol="a"),
+                Transition(from_state="q1", to_state="q2", symbol="a"),
+                Transition(from_state="q2", to_state="q1", symbol="a")
+            ],
+            initial_state="q0",
+            accept_states=["q1", "q2"]
+        )
+        block_of = hopcroft_partition(compile_fsa(dfa))
+        
+        assert block_of[1] == block_of[2]
+        assert block_of[0] != block_of[1]
+    
+    def test_missing_transition_distinguishes(self):
+        """Test that a missing transition acts like a dead state."""
+        dfa = FSA(
+            states=["q0", "q1"],
+            alphabet=["a"],
+            transitions=[
+                Transition(from_state="q0", to_state="q0", symbol="a")
+            ],
+            initial_state="q0",
+            accept_states=["q0", "q1"]
+        )
+        block_of = hopcroft_partition(compile_fsa(dfa))
+        
+        assert block_of[0] != block_of[1]
+
+
+class TestBuildMinimalDFA:
+    """Test build_minimal_dfa function."""
+    
+    def test_unknown_initial_state_raises(self):
+        """Test that an initial state outside the states is rejected."""
+        dfa = FSA(
+            states=["q0", "q1"],
+            alphabet=["a"],
+            transitions=[
+                Transition(from_state="q0", to_state="q1", symbol="a")
+            ],
+            initial_state="q9",
+            accept_states=["q1"]
+        )
+        compiled = compile_fsa(dfa)
+        
+        with pytest.raises(ValueError):
+            build_minimal_dfa(dfa, compiled, hopcroft_partition(compiled))
+
+
 class TestMinimizeDFA:
     """Test minimize_dfa function (alias for hopcroft_minimization)."""
     
@@ -309,9 +369,60 @@ class TestAreEquivalentDFAs:
         
         # After minimization, should be equivalent
         result = are_equivalent_dfas(dfa1, dfa2)
-        # Note: Full isomorphism check not implemented, 
-        # so this might not work perfectly yet
+        # Note: dfa1 needs three a's and dfa2 only one, so the languages
+        # differ; only the result type is checked here
         assert isinstance(result, bool)
+    
+    def test_same_size_different_language(self):
+        """Test DFAs with equally many minimal states but different languages."""
+        dfa1 = FSA(
+            states=["q0", "q1"],
+            alphabet=["a"],
+            transitions=[
+                Transition(from_state="q0", to_state="q1", symbol="a"),
+                Transition(from_state="q1", to_state="q0", symbol="a")
+            ],
+            initial_state="q0",
+            accept_states=["q1"]
+        )
+        dfa2 = FSA(
+            states=["q0", "q1"],
+            alphabet=["a"],
+            transitions=[
+                Transition(from_state="q0", to_state="q1", symbol="a"),
+                Transition(from_state="q1", to_state="q0", symbol="a")
+            ],
+            initial_state="q0",
+            accept_states=["q0"]
+        )
+        
+        assert are_equivalent_dfas(dfa1, dfa2) is False
+    
+    def test_partial_dfa_equivalent_to_explicit_dead_state(self):
+        """Test that missing transitions count as going to a dead state."""
+        partial = FSA(
+            states=["q0", "q1"],
+            alphabet=["a"],
+            transitions=[
+                Transition(from_state="q0", to_state="q1", symbol="a")
+            ],
+            initial_state="q0",
+            accept_states=["q1"]
+        )
+        complete = FSA(
+            states=["q0", "q1", "dead"],
+            alphabet=["a"],
+            transitions=[
+                Transition(from_state="q0", to_state="q1", symbol="a"),
+                Transition(from_state="q1", to_state="dead", symbol="a"),
+                Transition(from_state="dead", to_state="dead", symbol="a")
+            ],
+            initial_state="q0",
+            accept_states=["q1"]
+        )
+        
+        assert are_equivalent_dfas(partial, complete) is True
+        assert are_equivalent_dfas(complete, partial) is True
 
 
 class TestMinimizationProperties:
@@ -383,6 +383,33 @@ class TestSubsetConstructionEdgeCases:
         assert is_deterministic(dfa)
         assert dfa.initial_state in dfa.states
         assert all(state in dfa.states for state in dfa.accept_states)
+    
+    def test_exponential_blowup(self):
+        """Test (a|b)*a(a|b)^k, whose minimal DFA needs 2^(k+1) states."""
+        k = 4
+        transitions = [
+            Transition(from_state="s0", to_state="s0", symbol="a"),
+            Transition(from_state="s0", to_state="s0", symbol="b"),
+            Transition(from_state="s0", to_state="s1", symbol="a"),
+        ]
+        for i in range(1, k + 1):
+            for symbol in "ab":
+                transitions.append(
+                    Transition(from_state=f"s{i}", to_state=f"s{i + 1}", symbol=symbol)
+                )
+        nfa = FSA(
+            states=[f"s{i}" for i in range(k + 2)],
+            alphabet=["a", "b"],
+            transitions=transitions,
+            initial_state="s0",
+            accept_states=[f"s{k + 1}"]
+        )
+        dfa = subset_construction(nfa)
+        
+        # Every subset is reached exactly once: one transition per symbol each
+        assert len(dfa.states) == 2 ** (k + 1)
+        assert len(dfa.transitions) == 2 * len(dfa.states)
+        assert dfa.states == [f"q{i}" for i in range(len(dfa.states))]
 
 
 if __name__ == "__main__":
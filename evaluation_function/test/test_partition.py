@@ -0,0 +1,65 @@
+"""
+Tests for the refinable partition used by Hopcroft minimization.
+"""
+
+from evaluation_function.algorithms.partition import RefinablePartition
+
+
+class TestRefinablePartition:
+    """Test RefinablePartition class."""
+
+    def test_starts_as_single_set(self):
+        """Test that all elements start in set 0."""
+        p = RefinablePartition(4)
+
+        assert p.set_count == 1
+        assert sorted(p.members(0)) == [0, 1, 2, 3]
+
+    def test_split_moves_smaller_part(self):
+        """Test that the smaller part becomes the new set."""
+        p = RefinablePartition(5)
+        p.mark(3)
+        splits = p.split()
+
+        assert splits == [(0, 1)]
+        assert p.members(1) == [3]
+        assert sorted(p.members(0)) == [0, 1, 2, 4]
+        assert p.set_of[3] == 1
+
+    def test_split_keeps_marked_majority(self):
+        """Test that the unmarked part moves when it is smaller."""
+        p = RefinablePartition(4)
+        for e in (0, 1, 2):
+            p.mark(e)
+        p.split()
+
+        assert p.members(1) == [3]
+        assert sorted(p.members(0)) == [0, 1, 2]
+
+    def test_fully_marked_set_not_split(self):
+        """Test that marking a whole set leaves it intact."""
+        p = RefinablePartition(3)
+        for e in (0, 1, 2, 1):
+            p.mark(e)
+
+        assert p.split() == []
+        assert p.set_count == 1
+
+    def test_marks_cleared_after_split(self):
+        """Test that a split clears marks for the next round."""
+        p = RefinablePartition(4)
+        p.mark(0)
+        p.split()
+        p.mark(1)
+        p.split()
+
+        assert p.set_count == 3
+        assert len({p.set_of[e] for e in (0, 1, 2)}) == 3
+        assert p.set_of[2] == p.set_of[3]
+
+    def test_empty(self):
+        """Test that an empty partition has no sets."""
+        p = RefinablePartition(0)
+
+        assert p.set_count == 0
+        assert p.split() == []
@@ -5,6 +5,8 @@ Covers validation rules, determinism, completeness, reachability,
 dead states, string acceptance, language equivalence, and DFA isomorphism.
 """
 
+from collections import OrderedDict
+
 import pytest
 
 from evaluation_function.validation.validation import *
@@ -82,6 +84,20 @@ class TestFSAValidation:
         result = is_valid_fsa(fsa)
         assert ErrorCode.INVALID_SYMBOL in [e.code for e in result.errors]
 
+    def test_highlights_can_be_skipped(self):
+        fsa = make_fsa(
+            states=["q0", "q1"],
+            alphabet=["a"],
+            transitions=[{"from_state": "q0", "to_state": "q1", "symbol": "b"}],
+            initial="q0",
+            accept=["q2"],
+        )
+        with_highlights = is_valid_fsa(fsa)
+        without_highlights = is_valid_fsa(fsa, include_highlights=False)
+        assert all(e.highlight is not None for e in with_highlights.errors)
+        assert all(e.highlight is None for e in without_highlights.errors)
+        assert [e.code for e in with_highlights.errors] == [e.code for e in without_highlights.errors]
+
 
 class TestDeterminism:
     """Tests for determinism checking."""
@@ -147,6 +163,20 @@ class TestCompleteness:
         assert not result.ok
         assert ErrorCode.MISSING_TRANSITION in [e.code for e in result.errors]
 
+    def test_missing_transitions_in_declaration_order(self):
+        fsa = make_fsa(
+            states=["q0", "q1"],
+            alphabet=["a", "b"],
+            transitions=[
+                {"from_state": "q0", "to_state": "q1", "symbol": "b"},
+                {"from_state": "q1", "to_state": "q0", "symbol": "a"},
+            ],
+            initial="q0",
+            accept=["q1"],
+        )
+        missing = [(e.highlight.state_id, e.highlight.symbol) for e in is_complete(fsa).errors]
+        assert missing == [("q0", "a"), ("q1", "b")]
+
     def test_complete_requires_deterministic(self):
         fsa = make_fsa(
             states=["q0", "q1"],
@@ -163,6 +193,26 @@ class TestCompleteness:
         assert ErrorCode.NOT_DETERMINISTIC in codes
         assert ErrorCode.DUPLICATE_TRANSITION in codes
 
+    def test_structure_checks_determinism_once(self, monkeypatch):
+        import evaluation_function.validation.validation as validation
+
+        calls = []
+        original = validation.is_deterministic
+        monkeypatch.setattr(
+            validation, "is_deterministic",
+            lambda fsa, *args, **kwargs: calls.append(fsa) or original(fsa, *args, **kwargs),
+        )
+        fsa = make_fsa(
+            states=["q0", "q1"],
+            alphabet=["a"],
+            transitions=[{"from_state": "q0", "to_state": "q1", "symbol": "a"}],
+            initial="q0",
+            accept=["q1"],
+        )
+        info = get_structured_info_of_fsa(fsa)
+        assert info.is_deterministic and not info.is_complete
+        assert calls == [fsa]
+
 
 class TestReachabilityAndDeadStates:
     """Tests for unreachable and dead states."""
@@ -245,6 +295,89 @@ class TestStringAcceptance:
         )
         assert accepts_string(fsa, "").ok
 
+    def test_dfa_fast_path_matches_subset_simulation(self, simple_dfa):
+        # Same language as simple_dfa, but as an NFA so it takes the set path
+        nfa = simple_dfa.model_copy(deep=True)
+        nfa.transitions.append(nfa.transitions[0].model_copy())
+
+        for string in ["", "a", "b", "ab", "ba", "bba", "abab", "abb", "c"]:
+            dfa_result = accepts_string(simple_dfa, string)
+            nfa_result = accepts_string(nfa, string)
+            assert dfa_result.ok == nfa_result.ok
+            assert [e.code for e in dfa_result.errors] == [e.code for e in nfa_result.errors]
+
+    def test_fsa_accepts_matches_accepts_string(self, epsilon_nfa):
+        for string in ["", "a", "ab", "abb", "b", "aa", "c"]:
+            assert fsa_accepts(epsilon_nfa, string) == accepts_string(epsilon_nfa, string).ok
+
+    def test_fsa_accepts_invalid_fsa(self):
+        fsa = make_fsa(
+            states=["q0"],
+            alphabet=["a"],
+            transitions=[],
+            initial="q9",
+            accept=["q0"],
+        )
+        assert not fsa_accepts(fsa, "")
+
+    def test_accepts_string_sees_mutation(self):
+        fsa = make_fsa(
+            states=["q0", "q1"],
+            alphabet=["a"],
+            transitions=[{"from_state": "q0", "to_state": "q1", "symbol": "a"}],
+            initial="q0",
+            accept=["q1"],
+        )
+        assert accepts_string(fsa, "a").ok
+
+        fsa.accept_states = ["q0"]
+        assert not accepts_string(fsa, "a").ok
+        assert accepts_string(fsa, "").ok
+
+
+class TestMinimality:
+    """Tests for the minimality check."""
+
+    def _redundant_dfa(self, prefix):
+        # p1 and p2 are equivalent: both accepting, both loop to each other
+        return make_fsa(
+            states=[f"{prefix}0", f"{prefix}1", f"{prefix}2"],
+            alphabet=["a"],
+            transitions=[
+                {"from_state": f"{prefix}0", "to_state": f"{prefix}1", "symbol": "a"},
+                {"from_state": f"{prefix}1", "to_state": f"{prefix}2", "symbol": "a"},
+                {"from_state": f"{prefix}2", "to_state": f"{prefix}1", "symbol": "a"},
+            ],
+            initial=f"{prefix}0",
+            accept=[f"{prefix}1", f"{prefix}2"],
+        )
+
+    def test_redundant_dfa_is_not_minimal(self):
+        result = is_minimal(self._redundant_dfa("q"))
+        assert not result.ok
+        assert ErrorCode.NOT_MINIMAL in [e.code for e in result.errors]
+
+    def test_minimal_dfa(self, simple_dfa):
+        assert is_minimal(simple_dfa).ok
+
+    def test_minimization_reused_for_equivalence(self, monkeypatch):
+        import evaluation_function.validation.validation as validation
+
+        calls = []
+        original = validation.hopcroft_minimization
+        monkeypatch.setattr(
+            validation, "hopcroft_minimization",
+            lambda dfa: calls.append(dfa) or original(dfa),
+        )
+        monkeypatch.setattr(validation, "_minimized_cache", OrderedDict())
+        student = self._redundant_dfa("p")
+        expected = self._redundant_dfa("r")
+
+        is_minimal(student)
+        assert fsas_accept_same_language(student, expected).ok
+        # student minimized once; equivalent DFAs need no minimization
+        assert calls == [student]
+
 
 class TestLanguageEquivalence:
     """Tests for language equivalence."""
@@ -285,6 +418,83 @@ class TestLanguageEquivalence:
         assert not result.ok
         assert ErrorCode.LANGUAGE_MISMATCH in [e.code for e in result.errors]
 
+    def test_alphabet_mismatch_skips_minimization(self, simple_dfa, monkeypatch):
+        import evaluation_function.validation.validation as validation
+
+        calls = []
+        monkeypatch.setattr(validation, "_minimize", lambda dfa: calls.append(dfa))
+        other = make_fsa(
+            states=["s0"],
+            alphabet=["c"],
+            transitions=[{"from_state": "s0", "to_state": "s0", "symbol": "c"}],
+            initial="s0",
+            accept=["s0"],
+        )
+        result = fsas_accept_same_language(simple_dfa, other)
+        assert not result.ok
+        assert [e.message for e in result.errors] == [
+            "The alphabet of your FSA does not match the required alphabet."
+        ]
+        assert calls == []
+
+    def test_nfa_determinized_once(self, monkeypatch):
+        import evaluation_function.validation.validation as validation
+
+        calls = []
+        original = validation.nfa_to_dfa
+        monkeypatch.setattr(
+            validation, "nfa_to_dfa",
+            lambda fsa: calls.append(fsa) or original(fsa),
+        )
+        monkeypatch.setattr(validation, "_determinized_cache", OrderedDict())
+        nfa = make_fsa(
+            states=["q0", "q1"],
+            alphabet=["a"],
+            transitions=[
+                {"from_state": "q0", "to_state": "q0", "symbol": "a"},
+                {"from_state": "q0", "to_state": "q1", "symbol": "a"},
+            ],
+            initial="q0",
+            accept=["q1"],
+        )
+        dfa = make_fsa(
+            states=["p0"],
+            alphabet=["a"],
+            transitions=[{"from_state": "p0", "to_state": "p0", "symbol": "a"}],
+            initial="p0",
+            accept=["p0"],
+        )
+
+        fsas_accept_same_language(nfa, dfa)
+        fsas_accept_same_language(nfa, dfa)
+        assert calls == [nfa]
+
+    def test_explicit_dead_state_equivalent_to_missing_transitions(self):
+        partial = make_fsa(
+            states=["q0", "q1"],
+            alphabet=["a", "b"],
+            transitions=[
+                {"from_state": "q0", "to_state": "q1", "symbol": "a"},
+            ],
+            initial="q0",
+            accept=["q1"],
+        )
+        complete = make_fsa(
+            states=["s0", "s1", "dead"],
+            alphabet=["a", "b"],
+            transitions=[
+                {"from_state": "s0", "to_state": "s1", "symbol": "a"},
+                {"from_state": "s0", "to_state": "dead", "symbol": "b"},
+                {"from_state": "s1", "to_state": "dead", "symbol": "a"},
+                {"from_state": "s1", "to_state": "dead", "symbol": "b"},
+                {"from_state": "dead", "to_state": "dead", "symbol": "a"},
+                {"from_state": "dead", "to_state": "dead", "symbol": "b"},
+            ],
+            initial="s0",
+            accept=["s1"],
+        )
+        assert fsas_accept_same_language(partial, complete).ok
+
 
 class TestIsomorphism:
     """Tests for DFA isomorphism checking."""
@@ -1,18 +1,71 @@
-from typing import Dict, List, Optional, Set
-from collections import deque
+from typing import Any, Hashable, List, Optional, Set, Tuple
+from collections import OrderedDict, deque
 
 from evaluation_function.schemas.result import StructuralInfo
-from ..algorithms.minimization import hopcroft_minimization
+from ..algorithms.minimization import dfas_equivalent, hopcroft_minimization
 from ..algorithms.nfa_to_dfa import nfa_to_dfa, is_deterministic as is_dfa_check
-from ..algorithms.epsilon_closure import epsilon_closure_set, build_epsilon_transition_map
+from ..algorithms.compiled import (
+    compile_fsa,
+    compile_nfa,
+    transition_columns,
+)
 from ..schemas import FSA, ValidationError, ErrorCode, ElementHighlight, ValidationResult
 
 
+def _highlight(include_highlights: bool, **kwargs) -> Optional[ElementHighlight]:
+    """Build an ElementHighlight only when the caller wants UI highlights."""
+    if not include_highlights:
+        return None
+    return ElementHighlight(**kwargs)
+
+
+# =============================================================================
+# Per-FSA memoization
+# =============================================================================
+
+# Validators are pure w.r.t. the FSA contents, and the pipeline asks the
+# same questions about the same FSA several times. Keys are content
+# fingerprints, so mutating an FSA simply misses the cache. Cached values
+# are internal (tables and FSAs) and never handed out to callers.
+_CACHE_SIZE = 128
+_simulation_cache: "OrderedDict[Hashable, Tuple]" = OrderedDict()
+_minimized_cache: "OrderedDict[Hashable, FSA]" = OrderedDict()
+_determinized_cache: "OrderedDict[Hashable, Tuple[Optional[FSA]]]" = OrderedDict()
+
+
+def fsa_fingerprint(fsa: FSA) -> Tuple:
+    """Hashable snapshot of an FSA's contents."""
+    return (
+        tuple(fsa.states),
+        tuple(fsa.alphabet),
+        fsa.initial_state,
+        tuple(fsa.accept_states),
+        tuple((t.from_state, t.symbol, t.to_state) for t in fsa.transitions),
+    )
+
+
+def _cache_get(cache: "OrderedDict[Hashable, Any]", key: Hashable) -> Any:
+    value = cache.get(key)
+    if value is not None:
+        try:
+            cache.move_to_end(key)
+        except KeyError:
+            # Evicted by another thread since the get; the value is still good
+            pass
+    return value
+
+
+def _cache_put(cache: "OrderedDict[Hashable, Any]", key: Hashable, value: Any) -> None:
+    cache[key] = value
+    if len(cache) > _CACHE_SIZE:
+        cache.popitem(last=False)
+
+
 # =============================================================================
 # Structural validation
 # =============================================================================
 
-def is_valid_fsa(fsa: FSA) -> ValidationResult[bool]:
+def is_valid_fsa(fsa: FSA, include_highlights: bool = True) -> ValidationResult[bool]:
     errors: List[ValidationError] = []
     states = set(fsa.states)
     alphabet = set(fsa.alphabet)
@@ -44,7 +97,8 @@ def is_valid_fsa(fsa: FSA) -> ValidationResult[bool]:
                 message=f"Initial state '{fsa.initial_state}' does not exist.",
                 code=ErrorCode.INVALID_INITIAL,
                 severity="error",
-                highlight=ElementHighlight(
+                highlight=_highlight(
+                    include_highlights,
                     type="initial_state",
                     state_id=fsa.initial_state
                 )
@@ -58,7 +112,8 @@ def is_valid_fsa(fsa: FSA) -> ValidationResult[bool]:
                     message=f"Accepting state '{acc}' does not exist.",
                     code=ErrorCode.INVALID_ACCEPT,
                     severity="error",
-                    highlight=ElementHighlight(
+                    highlight=_highlight(
+                        include_highlights,
                         type="accept_state",
                         state_id=acc
                     )
@@ -72,7 +127,8 @@ def is_valid_fsa(fsa: FSA) -> ValidationResult[bool]:
                     message=f"Transition source '{t.from_state}' does not exist.",
                     code=ErrorCode.INVALID_TRANSITION_SOURCE,
                     severity="error",
-                    highlight=ElementHighlight(
+                    highlight=_highlight(
+                        include_highlights,
                         type="transition",
                         from_state=t.from_state,
                         to_state=t.to_state,
@@ -86,7 +142,8 @@ def is_valid_fsa(fsa: FSA) -> ValidationResult[bool]:
                     message=f"Transition destination '{t.to_state}' does not exist.",
                     code=ErrorCode.INVALID_TRANSITION_DEST,
                     severity="error",
-                    highlight=ElementHighlight(
+                    highlight=_highlight(
+                        include_highlights,
                         type="transition",
                         from_state=t.from_state,
                         to_state=t.to_state,
@@ -100,7 +157,8 @@ def is_valid_fsa(fsa: FSA) -> ValidationResult[bool]:
                     message=f"Symbol '{t.symbol}' not in alphabet.",
                     code=ErrorCode.INVALID_SYMBOL,
                     severity="error",
-                    highlight=ElementHighlight(
+                    highlight=_highlight(
+                        include_highlights,
                         type="transition",
                         from_state=t.from_state,
                         to_state=t.to_state,
@@ -120,26 +178,28 @@ def is_valid_fsa(fsa: FSA) -> ValidationResult[bool]:
 # Determinism & completeness
 # =============================================================================
 
-def is_deterministic(fsa: FSA) -> ValidationResult[bool]:
-    structural = is_valid_fsa(fsa)
+def is_deterministic(fsa: FSA, include_highlights: bool = True) -> ValidationResult[bool]:
+    structural = is_valid_fsa(fsa, include_highlights)
     if not structural.ok:
         return structural
 
     errors: List[ValidationError] = []
+    from_states, symbols, to_states = transition_columns(fsa.transitions)
 
     # Check for epsilon transitions (makes FSA non-deterministic)
-    for t in fsa.transitions:
-        if t.symbol in ("ε", "epsilon", ""):
+    for i, symbol in enumerate(symbols):
+        if symbol in ("ε", "epsilon", ""):
             errors.append(
                 ValidationError(
-                    message=f"Your FSA has an epsilon (ε) transition from '{t.from_state}' to '{t.to_state}'. A DFA cannot have epsilon transitions.",
+                    message=f"Your FSA has an epsilon (ε) transition from '{from_states[i]}' to '{to_states[i]}'. A DFA cannot have epsilon transitions.",
                     code=ErrorCode.NOT_DETERMINISTIC,
                     severity="error",
-                    highlight=ElementHighlight(
+                    highlight=_highlight(
+                        include_highlights,
                         type="transition",
-                        from_state=t.from_state,
-                        to_state=t.to_state,
-                        symbol=t.symbol
+                        from_state=from_states[i],
+                        to_state=to_states[i],
+                        symbol=symbol
                     ),
                     suggestion="Remove epsilon transitions to make this a DFA, or note that your FSA is an NFA/ε-NFA, which is also valid!"
                 )
@@ -149,19 +209,19 @@ def is_deterministic(fsa: FSA) -> ValidationResult[bool]:
 
     # Check for multiple transitions on same (state, symbol)
     seen: set = set()
-    for t in fsa.transitions:
-        key = (t.from_state, t.symbol)
+    for i, key in enumerate(zip(from_states, symbols)):
         if key in seen:
             errors.append(
                 ValidationError(
-                    message=f"Multiple transitions from '{t.from_state}' on '{t.symbol}'.",
+                    message=f"Multiple transitions from '{key[0]}' on '{key[1]}'.",
                     code=ErrorCode.DUPLICATE_TRANSITION,
                     severity="error",
-                    highlight=ElementHighlight(
+                    highlight=_highlight(
+                        include_highlights,
                         type="transition",
-                        from_state=t.from_state,
-                        to_state=t.to_state,
-                        symbol=t.symbol
+                        from_state=key[0],
+                        to_state=to_states[i],
+                        symbol=key[1]
                     )
                 )
             )
@@ -174,8 +234,14 @@ def is_deterministic(fsa: FSA) -> ValidationResult[bool]:
     )
 
 
-def is_complete(fsa: FSA) -> ValidationResult[bool]:
-    det = is_deterministic(fsa)
+def is_complete(fsa: FSA, include_highlights: bool = True) -> ValidationResult[bool]:
+    return _completeness(fsa, is_deterministic(fsa, include_highlights), include_highlights)
+
+
+def _completeness(
+    fsa: FSA, det: ValidationResult[bool], include_highlights: bool
+) -> ValidationResult[bool]:
+    """is_complete, given the FSA's is_deterministic result."""
     if not det.ok:
         return ValidationResult.failure(
             False,
@@ -189,19 +255,33 @@ def is_complete(fsa: FSA) -> ValidationResult[bool]:
         )
 
     errors: List[ValidationError] = []
-    states = set(fsa.states)
-    alphabet = set(fsa.alphabet)
-    transition_keys = {(t.from_state, t.symbol) for t in fsa.transitions}
-
-    for state in states:
-        for symbol in alphabet:
-            if (state, symbol) not in transition_keys:
+    state_idx = {s: i for i, s in enumerate(dict.fromkeys(fsa.states))}
+    symbol_idx = {a: i for i, a in enumerate(dict.fromkeys(fsa.alphabet))}
+    n_syms = len(symbol_idx)
+
+    # Encode each (state, symbol) pair as one small int: q * |Σ| + a
+    from_states, symbols, _ = transition_columns(fsa.transitions)
+    present: Set[int] = set()
+    for src, symbol in zip(from_states, symbols):
+        q = state_idx.get(src)
+        a = symbol_idx.get(symbol)
+        if q is not None and a is not None:
+            present.add(q * n_syms + a)
+
+    if len(present) == len(state_idx) * n_syms:
+        return ValidationResult.success(True)
+
+    for state, q in state_idx.items():
+        base = q * n_syms
+        for symbol, a in symbol_idx.items():
+            if base + a not in present:
                 errors.append(
                     ValidationError(
                         message=f"Missing transition from '{state}' on '{symbol}'.",
                         code=ErrorCode.MISSING_TRANSITION,
                         severity="error",
-                        highlight=ElementHighlight(
+                        highlight=_highlight(
+                            include_highlights,
                             type="state",
                             state_id=state,
                             symbol=symbol
@@ -220,30 +300,52 @@ def is_complete(fsa: FSA) -> ValidationResult[bool]:
 # Reachability & dead states
 # =============================================================================
 
-def find_unreachable_states(fsa: FSA) -> ValidationResult[List[str]]:
-    if fsa.initial_state not in set(fsa.states):
-        return ValidationResult.success([])
+def _iter_bits(mask: int):
+    """Indices of the set bits of mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
 
-    visited: Set[str] = set()
-    queue = deque([fsa.initial_state])
 
-    while queue:
-        state = queue.popleft()
-        if state in visited:
-            continue
-        visited.add(state)
-        for t in fsa.transitions:
-            if t.from_state == state and t.to_state not in visited:
-                queue.append(t.to_state)
+def _reach_mask(edges: List[int], start: int) -> int:
+    """
+    Bitset of everything reachable from the start mask, where edges[q] is
+    the mask of q's successors. Each level ORs whole successor masks, so
+    the work is one big-int OR per newly reached state.
+    """
+    reached = frontier = start
+    while frontier:
+        nxt = 0
+        for q in _iter_bits(frontier):
+            nxt |= edges[q]
+        frontier = nxt & ~reached
+        reached |= frontier
+    return reached
+
+
+def find_unreachable_states(fsa: FSA, include_highlights: bool = True) -> ValidationResult[List[str]]:
+    state_idx = {s: i for i, s in enumerate(dict.fromkeys(fsa.states))}
+    if fsa.initial_state not in state_idx:
+        return ValidationResult.success([])
+
+    # Undeclared transition endpoints get ids too, so paths through them count
+    from_states, _, to_states = transition_columns(fsa.transitions)
+    for s in from_states + to_states:
+        state_idx.setdefault(s, len(state_idx))
+    succ = [0] * len(state_idx)
+    for src, dst in zip(from_states, to_states):
+        succ[state_idx[src]] |= 1 << state_idx[dst]
 
-    unreachable = [s for s in fsa.states if s not in visited]
+    visited = _reach_mask(succ, 1 << state_idx[fsa.initial_state])
+    unreachable = [s for s in fsa.states if not (visited >> state_idx[s]) & 1]
 
     errors = [
         ValidationError(
             message=f"State '{s}' is unreachable.",
             code=ErrorCode.UNREACHABLE_STATE,
             severity="warning",
-            highlight=ElementHighlight(type="state", state_id=s)
+            highlight=_highlight(include_highlights, type="state", state_id=s)
         )
         for s in unreachable
     ]
@@ -255,7 +357,7 @@ def find_unreachable_states(fsa: FSA) -> ValidationResult[List[str]]:
     )
 
 
-def find_dead_states(fsa: FSA) -> ValidationResult[List[str]]:
+def find_dead_states(fsa: FSA, include_highlights: bool = True) -> ValidationResult[List[str]]:
     if not fsa.accept_states:
         dead = list(fsa.states)
         errors = [
@@ -263,34 +365,40 @@ def find_dead_states(fsa: FSA) -> ValidationResult[List[str]]:
                 message="No accepting states; language is empty.",
                 code=ErrorCode.DEAD_STATE,
                 severity="warning",
-                highlight=ElementHighlight(type="state", state_id=s)
+                highlight=_highlight(include_highlights, type="state", state_id=s)
             )
             for s in dead
         ]
         return ValidationResult.failure(dead, errors)
 
-    reachable_to_accept = set(fsa.accept_states)
-    queue = deque(fsa.accept_states)
-
-    predecessors: Dict[str, List[str]] = {s: [] for s in fsa.states}
-    for t in fsa.transitions:
-        if t.to_state in predecessors:
-            predecessors[t.to_state].append(t.from_state)
-
-    while queue:
-        state = queue.popleft()
-        for pred in predecessors.get(state, []):
-            if pred not in reachable_to_accept:
-                reachable_to_accept.add(pred)
-                queue.append(pred)
-
-    dead = [s for s in fsa.states if s not in reachable_to_accept]
+    state_idx = {s: i for i, s in enumerate(dict.fromkeys(fsa.states))}
+    n_declared = len(state_idx)
+
+    # Walk the transitions backwards from the accepting states; only edges
+    # into declared states are followed
+    from_states, _, to_states = transition_columns(fsa.transitions)
+    for s in from_states:
+        state_idx.setdefault(s, len(state_idx))
+    pred = [0] * len(state_idx)
+    for src, dst in zip(from_states, to_states):
+        q = state_idx.get(dst)
+        if q is not None and q < n_declared:
+            pred[q] |= 1 << state_idx[src]
+
+    start = 0
+    for s in fsa.accept_states:
+        q = state_idx.get(s)
+        if q is not None:
+            start |= 1 << q
+    reachable_to_accept = _reach_mask(pred, start)
+
+    dead = [s for s in fsa.states if not (reachable_to_accept >> state_idx[s]) & 1]
     errors = [
         ValidationError(
             message=f"State '{s}' is a dead state.",
             code=ErrorCode.DEAD_STATE,
             severity="warning",
-            highlight=ElementHighlight(type="state", state_id=s)
+            highlight=_highlight(include_highlights, type="state", state_id=s)
         )
         for s in dead
     ]
@@ -306,47 +414,53 @@ def find_dead_states(fsa: FSA) -> ValidationResult[List[str]]:
 # Simulation
 # =============================================================================
 
-def accepts_string(fsa: FSA, string: str) -> ValidationResult[bool]:
-    """Simulate the FSA on a string, with full ε-transition support."""
-    valid = is_valid_fsa(fsa)
-    if not valid.ok:
-        return valid
+def _simulation_tables(fsa: FSA) -> Tuple:
+    """
+    (valid, alphabet, compiled DFA, bitset NFA) for simulating an FSA.
 
-    # Build epsilon transition map for ε-closure computation
-    epsilon_trans = build_epsilon_transition_map(fsa.transitions)
+    Cached per FSA contents so checking many strings against the same FSA
+    validates it, indexes its transitions and builds its symbol sets only
+    once; a hit costs a single fingerprint. For a valid FSA exactly one of
+    the DFA table and the NFA bitsets is built; the other is None.
+    """
+    key = fsa_fingerprint(fsa)
+    tables = _cache_get(_simulation_cache, key)
+    if tables is None:
+        if not is_valid_fsa(fsa).ok:
+            tables = (False, None, None, None)
+        else:
+            deterministic = is_dfa_check(fsa)
+            tables = (
+                True,
+                frozenset(fsa.alphabet),
+                compile_fsa(fsa) if deterministic else None,
+                None if deterministic else compile_nfa(fsa),
+            )
+        _cache_put(_simulation_cache, key, tables)
+    return tables
 
-    # Start with ε-closure of the initial state
-    current_states: Set[str] = epsilon_closure_set({fsa.initial_state}, epsilon_trans)
 
-    for symbol in string:
-        if symbol not in fsa.alphabet:
-            return ValidationResult.failure(False, [
-                ValidationError(
-                    message=f"Symbol '{symbol}' not in alphabet.",
-                    code=ErrorCode.INVALID_SYMBOL,
-                    severity="error"
-                )
-            ])
+def _invalid_symbol(symbol: str) -> ValidationResult[bool]:
+    return ValidationResult.failure(False, [
+        ValidationError(
+            message=f"Symbol '{symbol}' not in alphabet.",
+            code=ErrorCode.INVALID_SYMBOL,
+            severity="error"
+        )
+    ])
 
-        next_states: Set[str] = set()
-        for state in current_states:
-            for t in fsa.transitions:
-                if t.from_state == state and t.symbol == symbol:
-                    next_states.add(t.to_state)
 
-        # Compute ε-closure of the states reached after reading the symbol
-        current_states = epsilon_closure_set(next_states, epsilon_trans)
+def _no_transition(string: str, symbol: str) -> ValidationResult[bool]:
+    return ValidationResult.failure(False, [
+        ValidationError(
+            message=f"String '{string}' rejected: no transition on symbol '{symbol}'.",
+            code=ErrorCode.TEST_CASE_FAILED,
+            severity="error"
+        )
+    ])
 
-        if not current_states:
-            return ValidationResult.failure(False, [
-                ValidationError(
-                    message=f"String '{string}' rejected: no transition on symbol '{symbol}'.",
-                    code=ErrorCode.TEST_CASE_FAILED,
-                    severity="error"
-                )
-            ])
 
-    accepted = any(s in fsa.accept_states for s in current_states)
+def _acceptance(accepted: bool, string: str) -> ValidationResult[bool]:
     return (
         ValidationResult.success(True)
         if accepted
@@ -360,15 +474,78 @@ def accepts_string(fsa: FSA, string: str) -> ValidationResult[bool]:
     )
 
 
+# Outcomes of _simulate
+_ACCEPT, _REJECT, _INVALID_SYMBOL, _NO_TRANSITION = range(4)
+
+
+def _simulate(tables: Tuple, string: str) -> Tuple[int, str]:
+    """
+    Run a structurally valid FSA, given its _simulation_tables, on a string.
+
+    Returns (outcome, symbol), where symbol is the input symbol that caused
+    an _INVALID_SYMBOL/_NO_TRANSITION outcome (empty otherwise). No
+    ValidationError objects are built here.
+    """
+    _, alphabet, dfa, nfa = tables
+
+    if dfa is not None:
+        # DFA fast path: one int table lookup per symbol, no state sets
+        q = dfa.initial
+        sym_to_idx = dfa.sym_to_idx
+        table = dfa.delta
+        for symbol in string:
+            a = sym_to_idx.get(symbol)
+            if a is None:
+                return (_NO_TRANSITION if symbol in alphabet else _INVALID_SYMBOL), symbol
+            q = table[q][a]
+            if q < 0:
+                return _NO_TRANSITION, symbol
+        return (_ACCEPT if dfa.is_accepting(q) else _REJECT), ""
+
+    # NFA path: the current state set is a bitmask, already ε-closed
+    current = nfa.initial_mask
+    sym_to_idx = nfa.sym_to_idx
+    for symbol in string:
+        a = sym_to_idx.get(symbol)
+        if a is None:
+            return (_NO_TRANSITION if symbol in alphabet else _INVALID_SYMBOL), symbol
+        current = nfa.move(current, a)
+        if not current:
+            return _NO_TRANSITION, symbol
+    return (_ACCEPT if current & nfa.accept_mask else _REJECT), ""
+
+
+def fsa_accepts(fsa: FSA, string: str) -> bool:
+    """
+    Whether the FSA accepts the string, without building any feedback.
+
+    Use this for yes/no probes; accepts_string explains why a string is
+    rejected. Structurally invalid FSAs accept nothing.
+    """
+    tables = _simulation_tables(fsa)
+    return tables[0] and _simulate(tables, string)[0] == _ACCEPT
+
+
+def accepts_string(fsa: FSA, string: str) -> ValidationResult[bool]:
+    """Simulate the FSA on a string, with full ε-transition support."""
+    tables = _simulation_tables(fsa)
+    if not tables[0]:
+        return is_valid_fsa(fsa)
+
+    outcome, symbol = _simulate(tables, string)
+    if outcome == _INVALID_SYMBOL:
+        return _invalid_symbol(symbol)
+    if outcome == _NO_TRANSITION:
+        return _no_transition(string, symbol)
+    return _acceptance(outcome == _ACCEPT, string)
+
+
 # =============================================================================
 # Language equivalence & minimality
 # =============================================================================
 
 def fsas_accept_same_string(fsa1: FSA, fsa2: FSA, string: str) -> ValidationResult[bool]:
-    r1 = accepts_string(fsa1, string)
-    r2 = accepts_string(fsa2, string)
-
-    if r1.ok != r2.ok:
+    if fsa_accepts(fsa1, string) != fsa_accepts(fsa2, string):
         return ValidationResult.failure(False, [
             ValidationError(
                 message=f"FSAs differ on string '{string}'.",
@@ -381,14 +558,31 @@ def fsas_accept_same_string(fsa1: FSA, fsa2: FSA, string: str) -> ValidationResu
 
 def fsas_accept_same_language(fsa1: FSA, fsa2: FSA) -> ValidationResult[bool]:
     # Convert NFA/ε-NFA to DFA before minimization (Hopcroft requires DFA input)
-    if not is_dfa_check(fsa1):
-        fsa1 = nfa_to_dfa(fsa1)
-    if not is_dfa_check(fsa2):
-        fsa2 = nfa_to_dfa(fsa2)
-
-    return are_isomorphic(
-        hopcroft_minimization(fsa1),
-        hopcroft_minimization(fsa2),
+    fsa1 = _as_dfa(fsa1)
+    fsa2 = _as_dfa(fsa2)
+
+    # Different alphabets are reported as such; no need to minimize
+    alphabet1 = set(fsa1.alphabet)
+    alphabet2 = set(fsa2.alphabet)
+    if alphabet1 != alphabet2:
+        return ValidationResult.failure(False, [_alphabet_mismatch(alphabet1, alphabet2)])
+
+    # Decide equivalence directly on the DFAs; only minimize and run the
+    # element-by-element comparison when there is feedback to produce
+    if dfas_equivalent(fsa1, fsa2):
+        return ValidationResult.success(True)
+
+    min1 = _minimize(fsa1)
+    min2 = _minimize(fsa2)
+    return are_isomorphic(min1, min2)
+
+
+def _alphabet_mismatch(alphabet1: Set[str], alphabet2: Set[str]) -> ValidationError:
+    return ValidationError(
+        message="The alphabet of your FSA does not match the required alphabet.",
+        code=ErrorCode.LANGUAGE_MISMATCH,
+        severity="error",
+        suggestion=f"Your alphabet: {alphabet1}. Expected: {alphabet2}."
     )
 
 
@@ -400,15 +594,10 @@ def are_isomorphic(fsa1: FSA, fsa2: FSA) -> ValidationResult[bool]:
     errors: List[ValidationError] = []
 
     # 1. Alphabet Check
-    if set(fsa1.alphabet) != set(fsa2.alphabet):
-        errors.append(
-            ValidationError(
-                message="The alphabet of your FSA does not match the required alphabet.",
-                code=ErrorCode.LANGUAGE_MISMATCH,
-                severity="error",
-                suggestion=f"Your alphabet: {set(fsa1.alphabet)}. Expected: {set(fsa2.alphabet)}."
-            )
-        )
+    alphabet1 = set(fsa1.alphabet)
+    alphabet2 = set(fsa2.alphabet)
+    if alphabet1 != alphabet2:
+        errors.append(_alphabet_mismatch(alphabet1, alphabet2))
 
     # 2. State Count Check
     if len(fsa1.states) != len(fsa2.states):
@@ -421,23 +610,26 @@ def are_isomorphic(fsa1: FSA, fsa2: FSA) -> ValidationResult[bool]:
             )
         )
 
-    # 3. State Mapping via BFS
-    mapping: Dict[str, str] = {fsa1.initial_state: fsa2.initial_state}
-    queue = deque([fsa1.initial_state])
-    visited = {fsa1.initial_state}
+    # 3. State Mapping via BFS (on interned int ids; names only for messages)
+    c1 = compile_fsa(fsa1)
+    c2 = compile_fsa(fsa2)
 
-    trans1 = {(t.from_state, t.symbol): t.to_state for t in fsa1.transitions}
-    trans2 = {(t.from_state, t.symbol): t.to_state for t in fsa2.transitions}
-    accept1 = set(fsa1.accept_states)
-    accept2 = set(fsa2.accept_states)
+    # Symbol index in fsa2 for every symbol of fsa1 (-1 if fsa2 lacks it)
+    sym_map = [c2.sym_to_idx.get(symbol, -1) for symbol in c1.symbols]
+    mapping: List[Optional[int]] = [None] * len(c1.states)
+    queue: deque = deque()
+    if c1.initial >= 0:
+        mapping[c1.initial] = c2.initial
+        queue.append(c1.initial)
 
     while queue:
-        s1 = queue.popleft()
-        s2 = mapping[s1]
+        q1 = queue.popleft()
+        q2 = mapping[q1]
+        s1 = c1.states[q1]
 
         # 4. Acceptance Parity
-        if (s1 in accept1) != (s2 in accept2):
-            expected_type = "accepting" if s2 in accept2 else "non-accepting"
+        if c1.is_accepting(q1) != c2.is_accepting(q2):
+            expected_type = "accepting" if c2.is_accepting(q2) else "non-accepting"
             errors.append(
                 ValidationError(
                     message=f"State '{s1}' is incorrectly marked. It should be an {expected_type} state.",
@@ -449,11 +641,12 @@ def are_isomorphic(fsa1: FSA, fsa2: FSA) -> ValidationResult[bool]:
             )
 
         # 5. Transitions
-        for symbol in fsa1.alphabet:
-            dest1 = trans1.get((s1, symbol))
-            dest2 = trans2.get((s2, symbol))
+        row1 = c1.delta[q1]
+        for a1, symbol in enumerate(c1.symbols):
+            dest1 = row1[a1]
+            dest2 = c2.step(q2, sym_map[a1])
 
-            if (dest1 is None) != (dest2 is None):
+            if (dest1 < 0) != (dest2 < 0):
                 errors.append(
                     ValidationError(
                         message=f"Missing or extra transition from state '{s1}' on symbol '{symbol}'.",
@@ -464,27 +657,25 @@ def are_isomorphic(fsa1: FSA, fsa2: FSA) -> ValidationResult[bool]:
                     )
                 )
 
-            if dest1 is not None:
-                if dest1 not in mapping:
+            if dest1 >= 0:
+                if mapping[dest1] is None:
                     mapping[dest1] = dest2
-                    visited.add(dest1)
                     queue.append(dest1)
-                else:
-                    if mapping[dest1] != dest2:
-                        errors.append(
-                            ValidationError(
-                                message=f"Transition from '{s1}' on '{symbol}' leads to the wrong state.",
-                                code=ErrorCode.LANGUAGE_MISMATCH,
-                                severity="error",
-                                highlight=ElementHighlight(
-                                    type="transition",
-                                    from_state=s1,
-                                    to_state=dest1,
-                                    symbol=symbol
-                                ),
-                                suggestion="Check if this transition should point to a different state."
-                            )
+                elif mapping[dest1] != dest2:
+                    errors.append(
+                        ValidationError(
+                            message=f"Transition from '{s1}' on '{symbol}' leads to the wrong state.",
+                            code=ErrorCode.LANGUAGE_MISMATCH,
+                            severity="error",
+                            highlight=ElementHighlight(
+                                type="transition",
+                                from_state=s1,
+                                to_state=c1.states[dest1],
+                                symbol=symbol
+                            ),
+                            suggestion="Check if this transition should point to a different state."
                         )
+                    )
 
     return (
         ValidationResult.success(True)
@@ -493,8 +684,40 @@ def are_isomorphic(fsa1: FSA, fsa2: FSA) -> ValidationResult[bool]:
     )
 
 
+def _as_dfa(fsa: FSA) -> FSA:
+    """
+    The FSA itself if it is a DFA, else its subset construction, cached per
+    FSA contents.
+
+    A shared expected answer would otherwise be determinized again for
+    every submission; this runs nfa_to_dfa once per distinct NFA.
+    """
+    key = fsa_fingerprint(fsa)
+    entry = _cache_get(_determinized_cache, key)
+    if entry is None:
+        # (None,) marks a DFA; the caller's object is not kept in the cache
+        entry = (None,) if is_dfa_check(fsa) else (nfa_to_dfa(fsa),)
+        _cache_put(_determinized_cache, key, entry)
+    return fsa if entry[0] is None else entry[0]
+
+
+def _minimize(dfa: FSA) -> FSA:
+    """
+    hopcroft_minimization, cached per DFA contents.
+
+    The correction pipeline minimizes the student's DFA for the minimality
+    check and again for language equivalence; this pays for it once.
+    """
+    key = fsa_fingerprint(dfa)
+    minimized = _cache_get(_minimized_cache, key)
+    if minimized is None:
+        minimized = hopcroft_minimization(dfa)
+        _cache_put(_minimized_cache, key, minimized)
+    return minimized
+
+
 def is_minimal(fsa: FSA) -> ValidationResult[bool]:
-    minimized = hopcroft_minimization(fsa)
+    minimized = _minimize(fsa)
     if len(minimized.states) < len(fsa.states):
         return ValidationResult.failure(False, [
             ValidationError(
@@ -511,10 +734,11 @@ def is_minimal(fsa: FSA) -> ValidationResult[bool]:
 # =============================================================================
 
 def get_structured_info_of_fsa(fsa: FSA) -> StructuralInfo:
-    det = is_deterministic(fsa)
-    comp = is_complete(fsa)
-    dead = find_dead_states(fsa)
-    unreachable = find_unreachable_states(fsa)
+    # Only the flags and state lists are used here, so skip the highlights
+    det = is_deterministic(fsa, include_highlights=False)
+    comp = _completeness(fsa, det, include_highlights=False)
+    dead = find_dead_states(fsa, include_highlights=False)
+    unreachable = find_unreachable_states(fsa, include_highlights=False)
 
     return StructuralInfo(
         is_deterministic=det.ok,